@@ -1,164 +1,138 @@
 """
 Performance Calculator - Real metrics from actual trades
 """
-from typing import Dict, List
+from typing import Dict, List, Tuple
 from datetime import datetime, timedelta
 import numpy as np
 from sqlalchemy.orm import Session
 import logging
 
 from backend.database.repositories.trade_repository import TradeRepository
+from backend.infra.cache import PERFORMANCE_CACHE, cached_method
 
 logger = logging.getLogger(__name__)
 
 
 class PerformanceCalculator:
-    """Calculate performance metrics from real trade data"""
+    """
+    Calculate performance metrics from real trade data
+    
+    Public metric methods are memoized for a short TTL in PERFORMANCE_CACHE;
+    TradeRepository invalidates the cache whenever trades are written.
+    """
     
     def __init__(self, db: Session):
         self.db = db
         self.trade_repo = TradeRepository(db)
     
+    @cached_method(PERFORMANCE_CACHE)
     def get_performance_metrics(self, days: int = 30) -> Dict:
         """Calculate comprehensive performance metrics"""
         stats = self.trade_repo.get_performance_stats(days)
         daily_pnl = self.trade_repo.get_daily_pnl(days)
+        returns = daily_pnl['pnl']
         
         # Calculate advanced metrics
-        sharpe_ratio = self._calculate_sharpe_ratio(daily_pnl)
-        max_drawdown = self._calculate_max_drawdown(daily_pnl)
-        sortino_ratio = self._calculate_sortino_ratio(daily_pnl)
+        sharpe_ratio, sortino_ratio = self._calculate_ratios(returns)
+        max_drawdown = self._calculate_max_drawdown(returns)
         
         return {
             **stats,
             'sharpe_ratio': sharpe_ratio,
             'sortino_ratio': sortino_ratio,
             'max_drawdown': max_drawdown,
-            'daily_pnl': daily_pnl[-30:],  # Last 30 days
-            'avg_daily_pnl': np.mean([d['pnl'] for d in daily_pnl]) if daily_pnl else 0,
-            'best_day': max([d['pnl'] for d in daily_pnl]) if daily_pnl else 0,
-            'worst_day': min([d['pnl'] for d in daily_pnl]) if daily_pnl else 0
+            'daily_pnl': [  # Last 30 days
+                {'date': str(date), 'pnl': pnl} for date, pnl in daily_pnl[-30:].tolist()
+            ],
+            'avg_daily_pnl': float(returns.mean()) if returns.size else 0,
+            'best_day': float(returns.max()) if returns.size else 0,
+            'worst_day': float(returns.min()) if returns.size else 0
         }
     
+    @cached_method(PERFORMANCE_CACHE)
     def get_tier_performance(self) -> Dict:
         """Get performance breakdown by signal tier"""
         from backend.database.models import Trade, Signal
-        from sqlalchemy import func
+        from sqlalchemy import func, case
         
         results = self.db.query(
             Signal.tier,
             func.count(Trade.id).label('count'),
             func.sum(Trade.pnl).label('total_pnl'),
-            func.avg(Trade.pnl).label('avg_pnl')
+            func.avg(Trade.pnl).label('avg_pnl'),
+            func.sum(case((Trade.pnl > 0, 1), else_=0)).label('wins')
         ).join(Trade, Signal.id == Trade.signal_id).filter(
             Trade.status.in_(['CLOSED', 'STOPPED'])
         ).group_by(Signal.tier).all()
         
         tier_stats = {}
-        for tier, count, total_pnl, avg_pnl in results:
+        for tier, count, total_pnl, avg_pnl, wins in results:
             tier_stats[tier] = {
                 'trades': count,
                 'total_pnl': float(total_pnl or 0),
                 'avg_pnl': float(avg_pnl or 0),
-                'win_rate': self._calculate_tier_win_rate(tier)
+                'win_rate': (wins or 0) / count * 100 if count else 0.0
             }
         
         return tier_stats
     
+    @cached_method(PERFORMANCE_CACHE)
     def get_monthly_returns(self) -> List[Dict]:
         """Calculate monthly returns"""
         from backend.database.models import Trade
+        from sqlalchemy import func
+        
+        # Group by month in the database (SQLite has no date_trunc/to_char)
+        if self.db.get_bind().dialect.name == 'sqlite':
+            month = func.strftime('%Y-%m', Trade.exit_time)
+        else:
+            month = func.to_char(func.date_trunc('month', Trade.exit_time), 'YYYY-MM')
+        month = month.label('month')
         
-        # Get all closed trades
-        trades = self.db.query(Trade).filter(
+        results = self.db.query(
+            month,
+            func.sum(Trade.pnl),
+            func.count(Trade.id)
+        ).filter(
             Trade.status.in_(['CLOSED', 'STOPPED']),
             Trade.exit_time.isnot(None)
-        ).all()
-        
-        # Group by month
-        monthly_pnl = {}
-        for trade in trades:
-            month_key = trade.exit_time.strftime('%Y-%m')
-            if month_key not in monthly_pnl:
-                monthly_pnl[month_key] = {
-                    'month': month_key,
-                    'pnl': 0.0,
-                    'trades': 0
-                }
-            monthly_pnl[month_key]['pnl'] += trade.pnl
-            monthly_pnl[month_key]['trades'] += 1
+        ).group_by(month).order_by(month).all()
         
-        return list(monthly_pnl.values())
+        return [
+            {'month': month_key, 'pnl': float(pnl or 0), 'trades': count}
+            for month_key, pnl, count in results
+        ]
     
-    def _calculate_sharpe_ratio(self, daily_pnl: List[Dict], risk_free_rate: float = 0.02) -> float:
-        """Calculate Sharpe ratio"""
-        if not daily_pnl or len(daily_pnl) < 2:
-            return 0.0
+    def _calculate_ratios(self, returns: np.ndarray, risk_free_rate: float = 0.02) -> Tuple[float, float]:
+        """Calculate Sharpe and Sortino ratios (Sortino only considers downside deviation)"""
+        if returns.size < 2:
+            return 0.0, 0.0
         
-        returns = [d['pnl'] for d in daily_pnl]
-        avg_return = np.mean(returns)
-        std_return = np.std(returns)
-        
-        if std_return == 0:
-            return 0.0
-        
-        # Annualize
+        # Annualized excess return, shared by both ratios
         daily_rf = risk_free_rate / 252
-        sharpe = (avg_return - daily_rf) / std_return * np.sqrt(252)
-        
-        return round(sharpe, 2)
-    
-    def _calculate_sortino_ratio(self, daily_pnl: List[Dict], risk_free_rate: float = 0.02) -> float:
-        """Calculate Sortino ratio (only considers downside deviation)"""
-        if not daily_pnl or len(daily_pnl) < 2:
-            return 0.0
+        excess = (returns.mean() - daily_rf) * np.sqrt(252)
         
-        returns = [d['pnl'] for d in daily_pnl]
-        avg_return = np.mean(returns)
+        std_return = returns.std()
+        sharpe = excess / std_return if std_return != 0 else 0.0
         
         # Calculate downside deviation
-        downside_returns = [r for r in returns if r < 0]
-        if not downside_returns:
-            return 0.0
-        
-        downside_std = np.std(downside_returns)
-        if downside_std == 0:
-            return 0.0
+        downside_returns = returns[returns < 0]
+        downside_std = downside_returns.std() if downside_returns.size else 0.0
+        sortino = excess / downside_std if downside_std != 0 else 0.0
         
-        daily_rf = risk_free_rate / 252
-        sortino = (avg_return - daily_rf) / downside_std * np.sqrt(252)
-        
-        return round(sortino, 2)
+        return round(float(sharpe), 2), round(float(sortino), 2)
     
-    def _calculate_max_drawdown(self, daily_pnl: List[Dict]) -> float:
+    def _calculate_max_drawdown(self, returns: np.ndarray) -> float:
         """Calculate maximum drawdown"""
-        if not daily_pnl:
+        if not returns.size:
             return 0.0
         
-        cumulative = [sum([d['pnl'] for d in daily_pnl[:i+1]]) for i in range(len(daily_pnl))]
-        
-        max_dd = 0.0
-        peak = cumulative[0]
+        cumulative = np.cumsum(returns)
+        peak = np.maximum.accumulate(cumulative)
         
-        for value in cumulative:
-            if value > peak:
-                peak = value
-            dd = (peak - value) / abs(peak) * 100 if peak != 0 else 0
-            max_dd = max(max_dd, dd)
+        # Drawdown is reported as 0 while the running peak is exactly 0
+        denom = np.where(peak != 0, np.abs(peak), 1.0)
+        drawdown = np.where(peak != 0, (peak - cumulative) / denom * 100.0, 0.0)
+        max_dd = float(drawdown.max())
         
         return round(max_dd, 2)
-    
-    def _calculate_tier_win_rate(self, tier: str) -> float:
-        """Calculate win rate for a specific tier"""
-        from backend.database.models import Trade, Signal
-        
-        trades = self.db.query(Trade).join(Signal, Signal.id == Trade.signal_id).filter(
-            Signal.tier == tier,
-            Trade.status.in_(['CLOSED', 'STOPPED'])
-        ).all()
-        
-        if not trades:
-            return 0.0
-        
-        winning_trades = sum(1 for t in trades if t.pnl > 0)
-        return (winning_trades / len(trades)) * 100
@@ -2,7 +2,7 @@
 STEALTH Bot FastAPI Backend
 Main API server with health check and market data endpoints
 """
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from typing import Dict, Any, Optional, List
@@ -24,6 +24,9 @@ from backend.api.routes.signals_enhanced import router as signals_router
 from backend.api.routes.performance_enhanced import router as performance_router
 from backend.api.routes.risk import router as risk_router
 
+# Import response class
+from backend.api.responses import ORJSONResponse
+
 # Import logging setup
 from backend.infra.file_logger import setup_file_logging, get_logger
 from backend.infra.request_logger import LoggingRoute
@@ -51,11 +54,25 @@ async def lifespan(app: FastAPI):
 app = FastAPI(
     title="STEALTH Bot API", 
     version="1.0.0",
+    # Serialize responses with orjson instead of the stdlib json encoder
+    default_response_class=ORJSONResponse,
     # Use custom route class for request logging
     route_class=LoggingRoute,
     lifespan=lifespan
 )
 
+# Registered before CORS so it runs inside it: an Exception handler would run
+# in ServerErrorMiddleware, outside CORS, and the browser could not read the 500
+@app.middleware("http")
+async def unhandled_exception_middleware(request: Request, call_next):
+    """Return uncaught route errors as JSON 500s so handlers can stay straight-line"""
+    try:
+        return await call_next(request)
+    except Exception as exc:
+        logger.error("Unhandled error on %s %s: %s", request.method, request.url.path, exc, exc_info=True)
+        return JSONResponse(status_code=500, content={"detail": str(exc)})
+
+
 # Configure CORS
 app.add_middleware(
     CORSMiddleware,
@@ -65,6 +82,7 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+
 # Include routers
 app.include_router(bot_router, prefix="/api")
 app.include_router(market_router, prefix="/api")
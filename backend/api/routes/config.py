@@ -4,19 +4,50 @@ Configuration API Routes
 from fastapi import APIRouter, HTTPException
 from typing import Dict, Any
 import logging
+import orjson
 import yaml
 from pathlib import Path
 
+# Prefer the LibYAML C bindings when PyYAML was built with them
+try:
+    from yaml import CSafeLoader as SafeLoader, CSafeDumper as SafeDumper
+except ImportError:
+    from yaml import SafeLoader, SafeDumper
+
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
 CONFIG_PATH = Path("backend/config/config.yml")
+# Parsed JSON copy of the YAML config, much cheaper to load than YAML
+CONFIG_JSON_PATH = CONFIG_PATH.with_suffix(".json")
+
+# Parsed config keyed by file mtime (invalidated on save)
+_CACHE = {"mtime": None, "data": None}
+
+def _write_json_sidecar(config: Dict[str, Any]):
+    """Write the JSON sidecar; failures only cost the fast path"""
+    try:
+        CONFIG_JSON_PATH.write_bytes(orjson.dumps(config))
+    except Exception as e:
+        logger.warning(f"Could not write config sidecar: {str(e)}")
 
 def load_config():
-    """Load configuration from YAML file"""
+    """Load configuration from YAML file (cached until the file changes)"""
     try:
-        with open(CONFIG_PATH, 'r') as f:
-            return yaml.safe_load(f)
+        mtime = CONFIG_PATH.stat().st_mtime_ns
+        if mtime == _CACHE["mtime"]:
+            return _CACHE["data"]
+        
+        if CONFIG_JSON_PATH.exists() and CONFIG_JSON_PATH.stat().st_mtime_ns >= mtime:
+            data = orjson.loads(CONFIG_JSON_PATH.read_bytes())
+        else:
+            with open(CONFIG_PATH, 'r') as f:
+                data = yaml.load(f, Loader=SafeLoader)
+            _write_json_sidecar(data)
+        
+        _CACHE["mtime"] = mtime
+        _CACHE["data"] = data
+        return data
     except Exception as e:
         logger.error(f"Error loading config: {str(e)}")
         return {}
@@ -24,8 +55,10 @@ def load_config():
 def save_config(config: Dict[str, Any]):
     """Save configuration to YAML file"""
     try:
+        _CACHE["mtime"] = None
         with open(CONFIG_PATH, 'w') as f:
-            yaml.dump(config, f, default_flow_style=False)
+            yaml.dump(config, f, Dumper=SafeDumper, default_flow_style=False)
+        _write_json_sidecar(config)
         return True
     except Exception as e:
         logger.error(f"Error saving config: {str(e)}")
@@ -34,126 +67,111 @@ def save_config(config: Dict[str, Any]):
 @router.get("/config")
 async def get_config():
     """Get current configuration"""
-    try:
-        config = load_config()
-        
-        # Ensure all expected fields exist
-        if "trading" not in config:
-            config["trading"] = {
-                "min_confidence": 0.7,
-                "max_positions": 10,
-                "default_position_size": 1000,
-                "max_position_size": 5000,
-                "risk_per_trade": 0.02
-            }
-        
-        if "scanning" not in config:
-            config["scanning"] = {
-                "universe_size": 100,
-                "scan_interval": 60,
-                "market_sessions": {
-                    "premarket": True,
-                    "regular": True,
-                    "afterhours": False
-                }
+    # Shallow copy so the defaults below don't leak into the cached config
+    config = dict(load_config() or {})
+    
+    # Ensure all expected fields exist
+    if "trading" not in config:
+        config["trading"] = {
+            "min_confidence": 0.7,
+            "max_positions": 10,
+            "default_position_size": 1000,
+            "max_position_size": 5000,
+            "risk_per_trade": 0.02
+        }
+    
+    if "scanning" not in config:
+        config["scanning"] = {
+            "universe_size": 100,
+            "scan_interval": 60,
+            "market_sessions": {
+                "premarket": True,
+                "regular": True,
+                "afterhours": False
             }
-        
-        if "modules" not in config:
-            config["modules"] = {}
-        
-        if "integrations" not in config:
-            config["integrations"] = {
-                "market_data": {
-                    "provider": "yahoo",
-                    "universe": ["SPY", "QQQ", "NVDA", "TSLA", "AAPL"]
-                }
+        }
+    
+    if "modules" not in config:
+        config["modules"] = {}
+    
+    if "integrations" not in config:
+        config["integrations"] = {
+            "market_data": {
+                "provider": "yahoo",
+                "universe": ["SPY", "QQQ", "NVDA", "TSLA", "AAPL"]
             }
-        
-        logger.info("Retrieved configuration")
-        
-        return {
-            "status": "success",
-            "data": config
         }
-    except Exception as e:
-        logger.error(f"Error getting config: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    
+    logger.info("Retrieved configuration")
+    
+    return {
+        "status": "success",
+        "data": config
+    }
 
 @router.put("/config")
 async def update_config(config: Dict[str, Any]):
     """Update configuration"""
-    try:
-        # Validate config structure
-        if not config:
-            raise ValueError("Configuration cannot be empty")
-        
-        # Save to file
-        if save_config(config):
-            logger.info("Configuration updated successfully")
-            return {
-                "status": "success",
-                "data": {
-                    "message": "Configuration updated successfully",
-                    "config": config
-                }
+    # Validate config structure
+    if not config:
+        raise HTTPException(status_code=400, detail="Configuration cannot be empty")
+    
+    # Save to file
+    if save_config(config):
+        logger.info("Configuration updated successfully")
+        return {
+            "status": "success",
+            "data": {
+                "message": "Configuration updated successfully",
+                "config": config
             }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to save configuration")
-            
-    except ValueError as e:
-        raise HTTPException(status_code=400, detail=str(e))
-    except Exception as e:
-        logger.error(f"Error updating config: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to save configuration")
 
 @router.post("/config/reset")
 async def reset_config():
     """Reset configuration to defaults"""
-    try:
-        default_config = {
-            "trading": {
-                "min_confidence": 0.7,
-                "max_positions": 10,
-                "default_position_size": 1000,
-                "max_position_size": 5000,
-                "risk_per_trade": 0.02
-            },
-            "scanning": {
-                "universe_size": 100,
-                "scan_interval": 60,
-                "market_sessions": {
-                    "premarket": True,
-                    "regular": True,
-                    "afterhours": False
-                }
-            },
-            "modules": {
-                "market_scanner": {"enabled": True},
-                "pattern_scorer": {"enabled": True},
-                "sentiment_analyzer": {"enabled": True},
-                "risk_engine": {"enabled": True},
-                "confidence_scorer": {"enabled": True}
-            },
-            "integrations": {
-                "market_data": {
-                    "provider": "yahoo",
-                    "universe": ["SPY", "QQQ", "NVDA", "TSLA", "AAPL"]
-                }
+    default_config = {
+        "trading": {
+            "min_confidence": 0.7,
+            "max_positions": 10,
+            "default_position_size": 1000,
+            "max_position_size": 5000,
+            "risk_per_trade": 0.02
+        },
+        "scanning": {
+            "universe_size": 100,
+            "scan_interval": 60,
+            "market_sessions": {
+                "premarket": True,
+                "regular": True,
+                "afterhours": False
+            }
+        },
+        "modules": {
+            "market_scanner": {"enabled": True},
+            "pattern_scorer": {"enabled": True},
+            "sentiment_analyzer": {"enabled": True},
+            "risk_engine": {"enabled": True},
+            "confidence_scorer": {"enabled": True}
+        },
+        "integrations": {
+            "market_data": {
+                "provider": "yahoo",
+                "universe": ["SPY", "QQQ", "NVDA", "TSLA", "AAPL"]
             }
         }
-        
-        if save_config(default_config):
-            logger.info("Configuration reset to defaults")
-            return {
-                "status": "success",
-                "data": {
-                    "message": "Configuration reset to defaults",
-                    "config": default_config
-                }
+    }
+    
+    if save_config(default_config):
+        logger.info("Configuration reset to defaults")
+        return {
+            "status": "success",
+            "data": {
+                "message": "Configuration reset to defaults",
+                "config": default_config
             }
-        else:
-            raise HTTPException(status_code=500, detail="Failed to reset configuration")
-            
-    except Exception as e:
-        logger.error(f"Error resetting config: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+        }
+    else:
+        raise HTTPException(status_code=500, detail="Failed to reset configuration")
\ No newline at end of file
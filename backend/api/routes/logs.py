@@ -2,43 +2,136 @@
 Log Viewing API Routes
 """
 from fastapi import APIRouter, HTTPException, Query
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Mapping, Optional, Tuple
+import asyncio
 import logging
+import os
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from datetime import datetime, timedelta
 from pathlib import Path
-import json
+import orjson
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+# Map log types to files
+_LOG_FILES: Mapping[str, str] = MappingProxyType({
+    "main": "stealth_bot.log",
+    "errors": "errors.log",
+    "trading": "trading.log",
+    "performance": "performance.log",
+    "market": "market_data.log"
+})
+_VALID_LOG_TYPES = frozenset(_LOG_FILES)
+
+# Line counts keyed by path, stored with the (st_mtime_ns, st_size) they were computed at
+_LINE_COUNTS: Dict[str, Tuple[Tuple[int, int], int]] = {}
+_COUNT_BLOCK_SIZE = 1 << 20
+_TAIL_BLOCK_SIZE = 1 << 16
+
+# Parsed tails keyed by (path, size, mtime_ns, lines, level), least recently used first
+_TAIL_CACHE: OrderedDict = OrderedDict()
+_TAIL_CACHE_SIZE = 32
+_TAIL_LOCK = threading.Lock()
+
+def _tail_lines(log_path: Path, lines: int) -> List[bytes]:
+    """Return the last N raw lines of a file without reading the whole file"""
+    if lines <= 0:
+        return []
+    
+    # Read backwards a block at a time until the buffer holds N full lines.
+    # Plain reads (not mmap) just come back short if /logs/clear truncates
+    # the file underneath us
+    data = b''
+    with open(log_path, 'rb') as f:
+        pos = f.seek(0, os.SEEK_END)
+        while pos > 0 and data.count(b'\n') <= lines:
+            step = min(_TAIL_BLOCK_SIZE, pos)
+            pos -= step
+            f.seek(pos)
+            data = f.read(step) + data
+    
+    if data.endswith(b'\n'):
+        data = data[:-1]
+    if not data:
+        return []
+    return data.split(b'\n')[-lines:]
+
+def count_lines(log_path: Path, file_stats: os.stat_result) -> int:
+    """Count lines in a file, cached until its size or mtime changes"""
+    key = str(log_path)
+    fingerprint = (file_stats.st_mtime_ns, file_stats.st_size)
+    cached = _LINE_COUNTS.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        return cached[1]
+    
+    # Count newlines a block at a time; bytes.count runs in C
+    count = 0
+    last = b'\n'
+    with open(log_path, 'rb') as f:
+        for block in iter(lambda: f.read(_COUNT_BLOCK_SIZE), b''):
+            count += block.count(b'\n')
+            last = block[-1:]
+    
+    # A final line without a trailing newline still counts
+    if last != b'\n':
+        count += 1
+    
+    _LINE_COUNTS[key] = (fingerprint, count)
+    return count
+
 def read_log_file(log_path: Path, lines: int = 100, level: Optional[str] = None):
-    """Read and parse log file"""
-    if not log_path.exists():
+    """Read and parse log file (cached until the file changes)"""
+    try:
+        file_stats = log_path.stat()
+    except FileNotFoundError:
         return []
     
+    # Logs are append-only, so size + mtime fingerprint the contents
+    key = (str(log_path), file_stats.st_size, file_stats.st_mtime_ns, lines, level)
+    with _TAIL_LOCK:
+        cached = _TAIL_CACHE.get(key)
+        if cached is not None:
+            _TAIL_CACHE.move_to_end(key)
+            return cached
+    
+    logs = _parse_tail(log_path, lines, level)
+    
+    with _TAIL_LOCK:
+        _TAIL_CACHE[key] = logs
+        if len(_TAIL_CACHE) > _TAIL_CACHE_SIZE:
+            _TAIL_CACHE.popitem(last=False)
+    return logs
+
+def _parse_tail(log_path: Path, lines: int, level: Optional[str]) -> List[Dict[str, Any]]:
+    """Parse the last N lines of a log file, optionally filtered by level"""
     logs = []
-    with open(log_path, 'r') as f:
-        # Read last N lines
-        all_lines = f.readlines()
-        recent_lines = all_lines[-lines:] if len(all_lines) > lines else all_lines
+    now_iso = datetime.now().isoformat()
+    # Byte patterns for the level field as written by json.dumps and by compact encoders
+    needles = (f'"level": "{level}"'.encode(), f'"level":"{level}"'.encode()) if level else ()
+    for line in _tail_lines(log_path, lines):
+        # Skip JSON lines that can't match the level without decoding them
+        if needles and line.startswith(b'{') and not any(n in line for n in needles):
+            continue
         
-        for line in recent_lines:
-            try:
-                # Try to parse as JSON
-                log_entry = json.loads(line.strip())
+        try:
+            # Try to parse as JSON (orjson takes the raw bytes directly)
+            log_entry = orjson.loads(line)
+            
+            # Filter by level if specified
+            if level and log_entry.get("level") != level:
+                continue
                 
-                # Filter by level if specified
-                if level and log_entry.get("level") != level:
-                    continue
-                    
-                logs.append(log_entry)
-            except json.JSONDecodeError:
-                # If not JSON, include as plain text
-                logs.append({
-                    "timestamp": datetime.now().isoformat(),
-                    "level": "INFO",
-                    "message": line.strip()
-                })
+            logs.append(log_entry)
+        except orjson.JSONDecodeError:
+            # If not JSON, include as plain text
+            logs.append({
+                "timestamp": now_iso,
+                "level": "INFO",
+                "message": line.strip().decode('utf-8', 'replace')
+            })
     
     return logs
 
@@ -52,20 +145,11 @@ async def get_logs(
     try:
         log_dir = Path("logs")
         
-        # Map log types to files
-        log_files = {
-            "main": "stealth_bot.log",
-            "errors": "errors.log",
-            "trading": "trading.log",
-            "performance": "performance.log",
-            "market": "market_data.log"
-        }
-        
-        if log_type not in log_files:
+        if log_type not in _VALID_LOG_TYPES:
             raise HTTPException(status_code=400, detail=f"Invalid log type: {log_type}")
         
-        log_path = log_dir / log_files[log_type]
-        logs = read_log_file(log_path, lines, level)
+        log_path = log_dir / _LOG_FILES[log_type]
+        logs = await asyncio.to_thread(read_log_file, log_path, lines, level)
         
         logger.info(f"Retrieved {len(logs)} log entries from {log_type}")
         
@@ -84,21 +168,27 @@ async def get_logs(
         logger.error(f"Error getting logs: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _stat_one(log_file: Path) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """Stat and line-count a single log file"""
+    if not log_file.is_file():
+        return None
+    
+    file_stats = log_file.stat()
+    return log_file.stem, {
+        "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
+        "modified": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
+        "lines": count_lines(log_file, file_stats)
+    }
+
 @router.get("/logs/stats")
 async def get_log_stats():
     """Get log statistics"""
     try:
-        log_dir = Path("logs")
-        stats = {}
+        log_files = await asyncio.to_thread(list, Path("logs").glob("*.log"))
         
-        for log_file in log_dir.glob("*.log"):
-            if log_file.is_file():
-                file_stats = log_file.stat()
-                stats[log_file.stem] = {
-                    "size_mb": round(file_stats.st_size / (1024 * 1024), 2),
-                    "modified": datetime.fromtimestamp(file_stats.st_mtime).isoformat(),
-                    "lines": sum(1 for _ in open(log_file))
-                }
+        # Stat and count files concurrently; the total is bounded by the slowest file
+        results = await asyncio.gather(*(asyncio.to_thread(_stat_one, f) for f in log_files))
+        stats = dict(r for r in results if r is not None)
         
         return {
             "status": "success",
@@ -108,6 +198,27 @@ async def get_log_stats():
         logger.error(f"Error getting log stats: {str(e)}")
         raise HTTPException(status_code=500, detail=str(e))
 
+def _clear_all(log_dir: Path) -> List[str]:
+    """Truncate every log file in a directory, returning their names"""
+    cleared = []
+    if not log_dir.is_dir():
+        return cleared
+    
+    # scandir yields cached d_type info, so no extra stat per entry
+    with os.scandir(log_dir) as entries:
+        for entry in entries:
+            if entry.name.endswith(".log") and entry.is_file():
+                os.truncate(entry.path, 0)
+                cleared.append(entry.name)
+    return cleared
+
+def _clear_one(log_path: Path):
+    """Truncate a single log file, creating it if it doesn't exist yet"""
+    try:
+        os.truncate(log_path, 0)
+    except FileNotFoundError:
+        log_path.touch()
+
 @router.delete("/logs/clear")
 async def clear_logs(log_type: str = Query("all", description="Type of log to clear")):
     """Clear log files"""
@@ -116,28 +227,17 @@ async def clear_logs(log_type: str = Query("all", description="Type of log to cl
         
         if log_type == "all":
             # Clear all log files
-            cleared = []
-            for log_file in log_dir.glob("*.log"):
-                log_file.write_text("")
-                cleared.append(log_file.name)
+            cleared = await asyncio.to_thread(_clear_all, log_dir)
             
             logger.info(f"Cleared all log files: {cleared}")
             message = f"Cleared {len(cleared)} log files"
         else:
             # Clear specific log file
-            log_files = {
-                "main": "stealth_bot.log",
-                "errors": "errors.log",
-                "trading": "trading.log",
-                "performance": "performance.log",
-                "market": "market_data.log"
-            }
-            
-            if log_type not in log_files:
+            if log_type not in _VALID_LOG_TYPES:
                 raise HTTPException(status_code=400, detail=f"Invalid log type: {log_type}")
             
-            log_path = log_dir / log_files[log_type]
-            log_path.write_text("")
+            log_path = log_dir / _LOG_FILES[log_type]
+            await asyncio.to_thread(_clear_one, log_path)
             
             logger.info(f"Cleared log file: {log_path}")
             message = f"Cleared {log_type} log file"
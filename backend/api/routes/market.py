@@ -5,6 +5,7 @@ from fastapi import APIRouter, HTTPException
 from typing import List, Dict, Optional
 from pydantic import BaseModel
 from backend.integrations.market_data import YahooFinanceClient
+import asyncio
 import logging
 
 logger = logging.getLogger(__name__)
@@ -13,6 +14,9 @@ router = APIRouter(prefix="/market", tags=["market"])
 # Global market data client
 market_client: Optional[YahooFinanceClient] = None
 
+# In-flight single-quote fetches, so concurrent requests for a symbol share one upstream call
+_INFLIGHT_QUOTES: Dict[str, asyncio.Future] = {}
+
 
 class MarketDataConfig(BaseModel):
     provider: str
@@ -29,44 +33,50 @@ def get_market_client() -> YahooFinanceClient:
     return market_client
 
 
+async def _fetch_quote(symbol: str) -> Dict:
+    """Fetch a quote off the event loop, joining any fetch already in flight"""
+    future = _INFLIGHT_QUOTES.get(symbol)
+    if future is None:
+        client = get_market_client()
+        future = asyncio.ensure_future(asyncio.to_thread(client.get_quote, symbol))
+        _INFLIGHT_QUOTES[symbol] = future
+        future.add_done_callback(lambda _: _INFLIGHT_QUOTES.pop(symbol, None))
+    # Shield so one cancelled request doesn't cancel the fetch for the others
+    return await asyncio.shield(future)
+
+
 @router.get("/quotes/{symbol}")
 async def get_quote(symbol: str):
     """Get quote for a single symbol"""
-    try:
-        logger.info(f"Fetching quote for {symbol}")
-        client = get_market_client()
-        quote = client.get_quote(symbol.upper())
-        logger.info(f"Quote fetched: {symbol} @ ${quote.get('price', 0)}")
-        return {"status": "success", "data": quote}
-    except Exception as e:
-        logger.error(f"Error fetching quote for {symbol}: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching quote for %s", symbol)
+    quote = await _fetch_quote(symbol.upper())
+    logger.info("Quote fetched: %s @ $%s", symbol, quote.get('price', 0))
+    return {"status": "success", "data": quote}
 
 
 @router.post("/quotes")
 async def get_quotes(symbols: List[str]):
     """Get quotes for multiple symbols"""
-    try:
-        logger.info(f"Fetching quotes for {len(symbols)} symbols: {symbols}")
-        client = get_market_client()
-        quotes = client.get_quotes([s.upper() for s in symbols])
-        logger.info(f"Successfully fetched {len(quotes)} quotes")
-        return {"status": "success", "data": quotes}
-    except Exception as e:
-        logger.error(f"Error fetching quotes: {e}", exc_info=True)
-        raise HTTPException(status_code=500, detail=str(e))
+    logger.info("Fetching quotes for %d symbols: %s", len(symbols), symbols)
+    client = get_market_client()
+    quotes = await asyncio.to_thread(client.get_quotes, [s.upper() for s in symbols])
+    logger.info("Successfully fetched %d quotes", len(quotes))
+    return {"status": "success", "data": quotes}
 
 
 @router.get("/status")
 async def get_market_status():
     """Get current market status"""
-    try:
-        client = get_market_client()
-        status = client.get_market_status()
-        return {"status": "success", "data": status}
-    except Exception as e:
-        logger.error(f"Error fetching market status: {e}")
-        raise HTTPException(status_code=500, detail=str(e))
+    client = get_market_client()
+    status = await asyncio.to_thread(client.get_market_status)
+    return {"status": "success", "data": status}
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """Get quote cache statistics"""
+    client = get_market_client()
+    return {"status": "success", "data": client.cache_stats()}
 
 
 @router.get("/test-yahoo")
@@ -77,13 +87,13 @@ async def test_yahoo_finance():
         client = get_market_client()
         
         # Test connection
-        is_connected = client.test_connection()
+        is_connected = await asyncio.to_thread(client.test_connection)
         logger.info(f"Connection test result: {is_connected}")
         
         # Try to fetch a sample quote
         sample_quote = None
         if is_connected:
-            sample_quote = client.get_quote("AAPL")
+            sample_quote = await asyncio.to_thread(client.get_quote, "AAPL")
             logger.info(f"Sample quote (AAPL): {sample_quote}")
         
         return {
@@ -109,14 +119,14 @@ async def test_connection(config: MarketDataConfig):
         # Create a new client with provided config
         if config.provider.lower() == "yahoo":
             test_client = YahooFinanceClient(api_key=config.api_key)
-            is_connected = test_client.test_connection()
+            is_connected = await asyncio.to_thread(test_client.test_connection)
             
             # Test with first symbol from universe if provided
             test_symbol = None
             test_quote = None
             if config.universe and len(config.universe) > 0:
                 test_symbol = config.universe[0]
-                test_quote = test_client.get_quote(test_symbol)
+                test_quote = await asyncio.to_thread(test_client.get_quote, test_symbol)
             
             return {
                 "status": "success",
@@ -147,7 +157,7 @@ async def configure_market_data(config: MarketDataConfig):
             
             # Store universe in config (you might want to persist this)
             # For now, we'll just validate it works
-            is_connected = market_client.test_connection()
+            is_connected = await asyncio.to_thread(market_client.test_connection)
             
             return {
                 "status": "success",
@@ -1,9 +1,11 @@
 """
 Module Management API Routes
 """
-from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
+from fastapi import APIRouter, HTTPException, Response
+from typing import Dict, Any, List, Optional
 import logging
+import orjson
+from array import array
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
@@ -103,134 +105,154 @@ MODULE_STATE = {
     }
 }
 
+def _build_index(state: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Build column-wise copies of the fields served by GET /modules"""
+    modules = list(state.values())
+    return {
+        "ids": [m["id"] for m in modules],
+        "names": [m["name"] for m in modules],
+        "status": [m["status"] for m in modules],
+        "enabled": [m["enabled"] for m in modules],
+        "performance": array('d', (m["performance"] for m in modules)),
+        "errors": array('i', (m["errors"] for m in modules))
+    }
+
+# Column-wise (SoA) view of MODULE_STATE for listing; kept in sync by _sync_index
+MODULE_INDEX = _build_index(MODULE_STATE)
+_MODULE_POS = {module_id: i for i, module_id in enumerate(MODULE_INDEX["ids"])}
+
+# Serialized GET /modules body, rebuilt lazily after any change to MODULE_INDEX
+_MODULES_BODY: Optional[bytes] = None
+
+def _sync_index(module_name: str):
+    """Copy a module's listed fields from MODULE_STATE into MODULE_INDEX"""
+    global _MODULES_BODY
+    _MODULES_BODY = None
+    i = _MODULE_POS[module_name]
+    module = MODULE_STATE[module_name]
+    MODULE_INDEX["status"][i] = module["status"]
+    MODULE_INDEX["enabled"][i] = module["enabled"]
+    MODULE_INDEX["performance"][i] = module["performance"]
+    MODULE_INDEX["errors"][i] = module["errors"]
+
+def _list_modules() -> List[Dict[str, Any]]:
+    """Build the GET /modules rows from MODULE_INDEX"""
+    return [
+        {
+            "id": module_id,
+            "name": name,
+            "status": status,
+            "enabled": enabled,
+            "performance": performance,
+            "errors": errors
+        }
+        for module_id, name, status, enabled, performance, errors in zip(
+            MODULE_INDEX["ids"],
+            MODULE_INDEX["names"],
+            MODULE_INDEX["status"],
+            MODULE_INDEX["enabled"],
+            MODULE_INDEX["performance"],
+            MODULE_INDEX["errors"]
+        )
+    ]
+
 @router.get("/modules")
 async def get_modules():
     """Get all module statuses"""
-    try:
-        modules_list = [
-            {
-                "id": module_data["id"],
-                "name": module_data["name"],
-                "status": module_data["status"],
-                "enabled": module_data["enabled"],
-                "performance": module_data["performance"],
-                "errors": module_data["errors"]
-            }
-            for module_data in MODULE_STATE.values()
-        ]
-        
-        logger.info(f"Retrieved {len(modules_list)} modules")
-        return {
+    global _MODULES_BODY
+    if _MODULES_BODY is None:
+        _MODULES_BODY = orjson.dumps({
             "status": "success",
-            "data": modules_list
-        }
-    except Exception as e:
-        logger.error(f"Error getting modules: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+            "data": _list_modules()
+        })
+    
+    logger.info("Retrieved %d modules", len(MODULE_INDEX["ids"]))
+    return Response(content=_MODULES_BODY, media_type="application/json")
 
 @router.post("/modules/{module_name}/toggle")
 async def toggle_module(module_name: str):
     """Toggle a module on/off"""
-    try:
-        if module_name not in MODULE_STATE:
-            raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
-        
-        module = MODULE_STATE[module_name]
-        module["enabled"] = not module["enabled"]
-        module["status"] = "running" if module["enabled"] else "idle"
-        
-        logger.info(f"Toggled module {module_name}: enabled={module['enabled']}")
-        
-        return {
-            "status": "success",
-            "data": {
-                "module": module_name,
-                "enabled": module["enabled"],
-                "status": module["status"]
-            }
+    if module_name not in MODULE_STATE:
+        raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
+    
+    module = MODULE_STATE[module_name]
+    module["enabled"] = not module["enabled"]
+    module["status"] = "running" if module["enabled"] else "idle"
+    _sync_index(module_name)
+    
+    logger.info("Toggled module %s: enabled=%s", module_name, module["enabled"])
+    
+    return {
+        "status": "success",
+        "data": {
+            "module": module_name,
+            "enabled": module["enabled"],
+            "status": module["status"]
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error toggling module {module_name}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    }
 
 @router.get("/modules/{module_name}")
 async def get_module_details(module_name: str):
     """Get detailed info about a specific module"""
-    try:
-        if module_name not in MODULE_STATE:
-            raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
-        
-        module = MODULE_STATE[module_name]
-        
-        # Return actual module data with configuration
-        detailed_info = {
-            **module,
-            "statistics": {
-                "total_runs": 1250,
-                "successful_runs": 1156,
-                "failed_runs": 94,
-                "avg_execution_time": 0.234
-            }
-        }
-        
-        return {
-            "status": "success",
-            "data": detailed_info
+    if module_name not in MODULE_STATE:
+        raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
+    
+    module = MODULE_STATE[module_name]
+    
+    # Return actual module data with configuration
+    detailed_info = {
+        **module,
+        "statistics": {
+            "total_runs": 1250,
+            "successful_runs": 1156,
+            "failed_runs": 94,
+            "avg_execution_time": 0.234
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error getting module details for {module_name}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    }
+    
+    return {
+        "status": "success",
+        "data": detailed_info
+    }
 
 @router.post("/modules/restart")
 async def restart_all_modules():
     """Restart all modules"""
-    try:
-        for module_id, module in MODULE_STATE.items():
-            if module["enabled"]:
-                module["status"] = "running"
-                module["last_run"] = datetime.now().isoformat()
-                module["errors"] = 0
-        
-        logger.info("All modules restarted")
-        
-        return {
-            "status": "success",
-            "data": {
-                "message": "All modules restarted successfully",
-                "timestamp": datetime.now().isoformat()
-            }
+    now_iso = datetime.now().isoformat()
+    for module_id, module in MODULE_STATE.items():
+        if module["enabled"]:
+            module["status"] = "running"
+            module["last_run"] = now_iso
+            module["errors"] = 0
+            _sync_index(module_id)
+    
+    logger.info("All modules restarted")
+    
+    return {
+        "status": "success",
+        "data": {
+            "message": "All modules restarted successfully",
+            "timestamp": now_iso
         }
-    except Exception as e:
-        logger.error(f"Error restarting modules: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
+    }
 
 @router.post("/modules/{module_name}/configure")
 async def configure_module(module_name: str, config: Dict[str, Any]):
     """Update module configuration"""
-    try:
-        if module_name not in MODULE_STATE:
-            raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
-        
-        module = MODULE_STATE[module_name]
-        module["configuration"].update(config)
-        module["last_run"] = datetime.now().isoformat()
-        
-        logger.info(f"Updated configuration for module {module_name}: {config}")
-        
-        return {
-            "status": "success",
-            "data": {
-                "module": module_name,
-                "configuration": module["configuration"],
-                "message": f"Configuration updated for {module['name']}"
-            }
+    if module_name not in MODULE_STATE:
+        raise HTTPException(status_code=404, detail=f"Module {module_name} not found")
+    
+    module = MODULE_STATE[module_name]
+    module["configuration"].update(config)
+    module["last_run"] = datetime.now().isoformat()
+    
+    logger.info("Updated configuration for module %s: %s", module_name, config)
+    
+    return {
+        "status": "success",
+        "data": {
+            "module": module_name,
+            "configuration": module["configuration"],
+            "message": f"Configuration updated for {module['name']}"
         }
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Error configuring module {module_name}: {str(e)}")
-        raise HTTPException(status_code=500, detail=str(e))
\ No newline at end of file
+    }
\ No newline at end of file
@@ -2,13 +2,14 @@
 Orchestration API Routes
 Real signal generation using the orchestrator
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from typing import Dict
+from fastapi import APIRouter, HTTPException
+from typing import Any, Dict, Optional
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+import asyncio
 import logging
 
-from backend.database import get_db
+from backend.database import get_db_session
 from backend.database.repositories.signal_repository import SignalRepository
 from backend.orchestrator import StealthBotOrchestrator
 from backend.integrations.universe_provider import UniverseProvider
@@ -20,6 +21,16 @@ logger = logging.getLogger(__name__)
 _orchestrator = None
 _universe_provider = None
 
+# Scans run here, off the event loop; a single worker keeps ticks serialized
+# since the orchestrator's cooldown registry is not thread-safe
+_scan_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="orchestrator-scan")
+
+# Shared stand-in for missing nested dicts in scan output (never mutated)
+_EMPTY: Dict[str, Any] = {}
+
+# Scan in flight, shared by every /orchestrate/scan call that arrives while it runs
+_pending_scan: Optional[asyncio.Future] = None
+
 
 def get_orchestrator():
     """Get or create orchestrator instance"""
@@ -39,66 +50,108 @@ def get_universe():
     return _universe_provider
 
 
+def _to_row(signal_data: Dict[str, Any], stamp: str, index: int, created_at: datetime) -> Optional[Dict[str, Any]]:
+    """Map one scan signal to a signals table row, or None if it has no symbol"""
+    symbol = signal_data.get('symbol')
+    if not symbol:
+        return None
+    
+    modules = signal_data.get('modules') or _EMPTY
+    scanner = modules.get('market_scanner') or _EMPTY
+    
+    return {
+        # index keeps ids unique when a scan yields a symbol more than once,
+        # so one duplicate can't fail the whole batch insert
+        'signal_id': f"SIG_{stamp}_{symbol}_{index}",
+        'symbol': symbol,
+        'action': 'BUY',  # Default action
+        'tier': signal_data.get('tier', 'BRONZE'),
+        'confidence': signal_data.get('confidence', 0),
+        'entry_price': scanner.get('price', 0),
+        'modules_data': modules,
+        'reasoning': f"Aggregate score: {signal_data.get('aggregate_score')}",
+        'created_at': created_at
+    }
+
+
+def _scan_and_store() -> Dict[str, Any]:
+    """Run one orchestrator tick and store its signals (blocking; executed in _scan_pool)"""
+    context = {
+        'session': 'regular',
+        'timestamp': datetime.now().isoformat()
+    }
+    
+    result = get_orchestrator().run_autowired_tick(context, get_universe())
+    
+    # Build rows for high-quality signals and store them in one batch
+    stamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    created_at = datetime.utcnow()
+    rows = [
+        row for row in (
+            _to_row(signal_data, stamp, i, created_at)
+            for i, signal_data in enumerate(result.get('signals', []))
+        )
+        # Only store high-quality signals
+        if row is not None and row['confidence'] >= 60
+    ]
+    
+    stored_signals = []
+    try:
+        with get_db_session() as db:
+            SignalRepository(db).create_many(rows)
+        stored_signals = [
+            {
+                'signal_id': row['signal_id'],
+                'symbol': row['symbol'],
+                'tier': row['tier'],
+                'confidence': row['confidence']
+            }
+            for row in rows
+        ]
+    except Exception as e:
+        logger.error(f"Error storing signals: {e}")
+    
+    return {
+        'total_scanned': len(result.get('signals', [])),
+        'signals_stored': len(stored_signals),
+        'signals': stored_signals,
+        'latency': result.get('latency'),
+        'errors': result.get('errors', [])
+    }
+
+
+async def _coalesced_scan() -> Dict[str, Any]:
+    """Run a scan, joining the one already in flight if there is one"""
+    global _pending_scan
+    future = _pending_scan
+    if future is None:
+        loop = asyncio.get_running_loop()
+        future = asyncio.ensure_future(loop.run_in_executor(_scan_pool, _scan_and_store))
+        _pending_scan = future
+        
+        def _reset(_):
+            global _pending_scan
+            _pending_scan = None
+        
+        future.add_done_callback(_reset)
+    # Shield so one disconnected client doesn't cancel the scan for the others
+    return await asyncio.shield(future)
+
+
 @router.post("/orchestrate/scan")
-async def run_scan(db: Session = Depends(get_db)):
+async def run_scan():
     """
     Run a full market scan using the orchestrator
     Generates real signals and stores them in the database
+    
+    Concurrent calls share a single scan and all receive its result.
     """
     try:
-        orchestrator = get_orchestrator()
-        universe_provider = get_universe()
-        
-        # Execute scan
-        context = {
-            'session': 'regular',
-            'timestamp': datetime.now().isoformat()
-        }
-        
-        result = orchestrator.run_autowired_tick(context, universe_provider)
-        
-        # Store signals in database
-        signal_repo = SignalRepository(db)
-        stored_signals = []
-        
-        for signal_data in result.get('signals', []):
-            try:
-                # Extract signal data
-                db_signal_data = {
-                    'signal_id': f"SIG_{datetime.now().strftime('%Y%m%d_%H%M%S')}_{signal_data.get('symbol')}",
-                    'symbol': signal_data.get('symbol'),
-                    'action': 'BUY',  # Default action
-                    'tier': signal_data.get('tier', 'BRONZE'),
-                    'confidence': signal_data.get('confidence', 0),
-                    'entry_price': signal_data.get('modules', {}).get('market_scanner', {}).get('price', 0),
-                    'modules_data': signal_data.get('modules', {}),
-                    'reasoning': f"Aggregate score: {signal_data.get('aggregate_score')}",
-                    'created_at': datetime.utcnow()
-                }
-                
-                # Only store high-quality signals
-                if db_signal_data['confidence'] >= 60:
-                    signal = signal_repo.create(db_signal_data)
-                    stored_signals.append({
-                        'signal_id': signal.signal_id,
-                        'symbol': signal.symbol,
-                        'tier': signal.tier,
-                        'confidence': signal.confidence
-                    })
-                    
-            except Exception as e:
-                logger.error(f"Error storing signal: {e}")
-                continue
+        data = await _coalesced_scan()
         
         return {
             'status': 'success',
-            'data': {
-                'total_scanned': len(result.get('signals', [])),
-                'signals_stored': len(stored_signals),
-                'signals': stored_signals,
-                'latency': result.get('latency'),
-                'errors': result.get('errors', [])
-            }
+            'data': data
         }
         
     except Exception as e:
@@ -110,14 +163,14 @@ async def run_scan(db: Session = Depends(get_db)):
 async def get_orchestrator_status():
     """Get orchestrator status"""
     try:
-        orchestrator = get_orchestrator()
+        module_names = get_orchestrator().module_names()
         
         return {
             'status': 'success',
             'data': {
                 'active': True,
-                'modules_loaded': len(orchestrator.modules),
-                'modules': list(orchestrator.modules.keys())
+                'modules_loaded': len(module_names),
+                'modules': module_names
             }
         }
     except Exception as e:
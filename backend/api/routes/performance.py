@@ -5,63 +5,65 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 import logging
 from datetime import datetime, timedelta
-import random
+import numpy as np
+
+from backend.infra.cache import MOCK_DATA_CACHE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_rng = np.random.default_rng()
+
+# Static tier breakdown, shared by every payload (never mutated)
+_TIER_PERFORMANCE = (
+    {
+        "tier": "PLATINUM",
+        "win_rate": 78.5,
+        "avg_return": 4.2,
+        "trades": 45
+    },
+    {
+        "tier": "GOLD",
+        "win_rate": 65.3,
+        "avg_return": 2.8,
+        "trades": 89
+    },
+    {
+        "tier": "SILVER",
+        "win_rate": 52.1,
+        "avg_return": 1.5,
+        "trades": 156
+    },
+    {
+        "tier": "BRONZE",
+        "win_rate": 41.2,
+        "avg_return": 0.8,
+        "trades": 234
+    }
+)
+
 def generate_performance_data():
     """Generate mock performance metrics"""
-    # Daily P&L for last 30 days
-    daily_pnl = []
-    for i in range(30):
-        date = (datetime.now() - timedelta(days=29-i)).strftime("%Y-%m-%d")
-        pnl = round(random.uniform(-5000, 10000), 2)
-        daily_pnl.append({"date": date, "pnl": pnl})
+    now = datetime.now()
     
-    # Tier performance
-    tier_performance = [
-        {
-            "tier": "PLATINUM",
-            "win_rate": 78.5,
-            "avg_return": 4.2,
-            "trades": 45
-        },
-        {
-            "tier": "GOLD",
-            "win_rate": 65.3,
-            "avg_return": 2.8,
-            "trades": 89
-        },
-        {
-            "tier": "SILVER",
-            "win_rate": 52.1,
-            "avg_return": 1.5,
-            "trades": 156
-        },
-        {
-            "tier": "BRONZE",
-            "win_rate": 41.2,
-            "avg_return": 0.8,
-            "trades": 234
-        }
-    ]
+    # Daily P&L for last 30 days
+    dates = [(now - timedelta(days=29-i)).strftime("%Y-%m-%d") for i in range(30)]
+    pnls = np.round(_rng.uniform(-5000, 10000, 30), 2)
+    daily_pnl = [{"date": date, "pnl": pnl} for date, pnl in zip(dates, pnls.tolist())]
     
     # Monthly returns
-    monthly_returns = []
-    for i in range(12):
-        month = (datetime.now() - timedelta(days=30*i)).strftime("%b %Y")
-        ret = round(random.uniform(-10, 25), 2)
-        monthly_returns.append({"month": month, "return": ret})
+    months = [(now - timedelta(days=30*i)).strftime("%b %Y") for i in range(12)]
+    returns = np.round(_rng.uniform(-10, 25, 12), 2)
+    monthly_returns = [{"month": month, "return": ret} for month, ret in zip(months, returns.tolist())]
     
     return {
-        "total_pnl": sum(d["pnl"] for d in daily_pnl),
+        "total_pnl": float(pnls.sum()),
         "win_rate": 62.5,
         "sharpe_ratio": 1.85,
         "max_drawdown": -12.3,
         "total_trades": 524,
         "daily_pnl": daily_pnl,
-        "tier_performance": tier_performance,
+        "tier_performance": _TIER_PERFORMANCE,
         "monthly_returns": monthly_returns
     }
 
@@ -69,7 +71,7 @@ def generate_performance_data():
 async def get_performance():
     """Get performance metrics"""
     try:
-        data = generate_performance_data()
+        data = MOCK_DATA_CACHE.get_or_set("performance", generate_performance_data)
         
         logger.info("Retrieved performance metrics")
         
@@ -85,7 +87,9 @@ async def get_performance():
 async def get_performance_summary():
     """Get performance summary"""
     try:
-        data = generate_performance_data()
+        data = MOCK_DATA_CACHE.get_or_set("performance", generate_performance_data)
+        daily_pnl = data["daily_pnl"]
+        pnls = np.array([d["pnl"] for d in daily_pnl])
         
         summary = {
             "total_pnl": data["total_pnl"],
@@ -93,9 +97,9 @@ async def get_performance_summary():
             "sharpe_ratio": data["sharpe_ratio"],
             "max_drawdown": data["max_drawdown"],
             "total_trades": data["total_trades"],
-            "best_day": max(data["daily_pnl"], key=lambda x: x["pnl"]),
-            "worst_day": min(data["daily_pnl"], key=lambda x: x["pnl"]),
-            "avg_daily_pnl": round(sum(d["pnl"] for d in data["daily_pnl"]) / len(data["daily_pnl"]), 2)
+            "best_day": daily_pnl[int(pnls.argmax())],
+            "worst_day": daily_pnl[int(pnls.argmin())],
+            "avg_daily_pnl": round(float(pnls.mean()), 2)
         }
         
         return {
@@ -110,23 +114,37 @@ async def get_performance_summary():
 async def get_recent_trades():
     """Get recent trades"""
     try:
-        trades = []
-        for i in range(20):
-            trades.append({
+        now = datetime.now()
+        n, closed = 20, 10
+        
+        # Draw every column in one call each
+        symbols = _rng.choice(["NVDA", "TSLA", "AAPL", "AMD", "META"], n).tolist()
+        sides = _rng.choice(["BUY", "SELL"], n).tolist()
+        quantities = _rng.choice([100, 200, 300, 500], n).tolist()
+        entry_prices = np.round(_rng.uniform(100, 500, n), 2).tolist()
+        exit_prices = np.round(_rng.uniform(100, 500, closed), 2).tolist()
+        pnls = np.round(_rng.uniform(-1000, 3000, closed), 2).tolist()
+        hours_ago = _rng.integers(0, 73, n)
+        
+        # Newest first: fewest hours ago first (stable, like sorting the timestamps)
+        trades = [
+            {
                 "id": f"trade_{i+1}",
-                "symbol": random.choice(["NVDA", "TSLA", "AAPL", "AMD", "META"]),
-                "side": random.choice(["BUY", "SELL"]),
-                "quantity": random.choice([100, 200, 300, 500]),
-                "entry_price": round(random.uniform(100, 500), 2),
-                "exit_price": round(random.uniform(100, 500), 2) if i < 10 else None,
-                "pnl": round(random.uniform(-1000, 3000), 2) if i < 10 else None,
-                "status": "CLOSED" if i < 10 else "OPEN",
-                "timestamp": (datetime.now() - timedelta(hours=random.randint(0, 72))).isoformat()
-            })
+                "symbol": symbols[i],
+                "side": sides[i],
+                "quantity": quantities[i],
+                "entry_price": entry_prices[i],
+                "exit_price": exit_prices[i] if i < closed else None,
+                "pnl": pnls[i] if i < closed else None,
+                "status": "CLOSED" if i < closed else "OPEN",
+                "timestamp": (now - timedelta(hours=int(hours_ago[i]))).isoformat()
+            }
+            for i in np.argsort(hours_ago, kind="stable").tolist()
+        ]
         
         return {
             "status": "success",
-            "data": sorted(trades, key=lambda x: x["timestamp"], reverse=True)
+            "data": trades
         }
     except Exception as e:
         logger.error(f"Error getting recent trades: {str(e)}")
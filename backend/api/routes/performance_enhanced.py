@@ -3,8 +3,9 @@ Enhanced Performance Route with Real Data
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import Optional
+from typing import Dict, List, Optional
 from datetime import datetime, timedelta
+from pydantic import BaseModel
 import logging
 
 from backend.database import get_db
@@ -14,12 +15,105 @@ router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
-@router.get("/performance")
-async def get_performance(days: int = 30, db: Session = Depends(get_db)):
+# Response models: FastAPI serializes these with pydantic-core instead of
+# walking the payload through jsonable_encoder
+class DailyPnl(BaseModel):
+    date: str
+    pnl: float
+
+
+class PerformanceSummary(BaseModel):
+    total_pnl: float
+    win_rate: float
+    sharpe_ratio: float
+    max_drawdown: float
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    avg_win: float
+    avg_loss: float
+    best_day: float
+    worst_day: float
+    avg_daily_pnl: float
+
+
+class PerformanceMetrics(BaseModel):
+    total_trades: int
+    winning_trades: int
+    losing_trades: int
+    total_pnl: float
+    win_rate: float
+    avg_win: float
+    avg_loss: float
+    profit_factor: float
+    sharpe_ratio: float
+    sortino_ratio: float
+    max_drawdown: float
+    daily_pnl: List[DailyPnl]
+    avg_daily_pnl: float
+    best_day: float
+    worst_day: float
+
+
+class TierStats(BaseModel):
+    trades: int
+    total_pnl: float
+    avg_pnl: float
+    win_rate: float
+
+
+class MonthlyReturn(BaseModel):
+    month: str
+    pnl: float
+    trades: int
+
+
+class TradeRow(BaseModel):
+    trade_id: str
+    symbol: str
+    side: str
+    entry_price: float
+    exit_price: Optional[float] = None
+    quantity: int
+    pnl: Optional[float] = None
+    pnl_percent: Optional[float] = None
+    status: Optional[str] = None
+    close_reason: Optional[str] = None
+    entry_time: Optional[datetime] = None
+    exit_time: Optional[datetime] = None
+
+
+class PerformanceResponse(BaseModel):
+    status: str
+    data: PerformanceMetrics
+
+
+class PerformanceSummaryResponse(BaseModel):
+    status: str
+    data: PerformanceSummary
+
+
+class TierPerformanceResponse(BaseModel):
+    status: str
+    data: Dict[str, TierStats]
+
+
+class MonthlyPerformanceResponse(BaseModel):
+    status: str
+    data: List[MonthlyReturn]
+
+
+class RecentTradesResponse(BaseModel):
+    status: str
+    data: List[TradeRow]
+
+
+@router.get("/performance", response_model=PerformanceResponse)
+def get_performance(days: int = 30, db: Session = Depends(get_db)):
     """Get comprehensive performance metrics"""
     try:
         calc = PerformanceCalculator(db)
-        metrics = calc.get_performance_metrics(days)
+        metrics = calc.get_performance_metrics(days=days)
         
         return {
             'status': 'success',
@@ -30,8 +124,8 @@ async def get_performance(days: int = 30, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/performance/summary")
-async def get_performance_summary(db: Session = Depends(get_db)):
+@router.get("/performance/summary", response_model=PerformanceSummaryResponse)
+def get_performance_summary(db: Session = Depends(get_db)):
     """Get performance summary"""
     try:
         calc = PerformanceCalculator(db)
@@ -61,8 +155,8 @@ async def get_performance_summary(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/performance/tier")
-async def get_tier_performance(db: Session = Depends(get_db)):
+@router.get("/performance/tier", response_model=TierPerformanceResponse)
+def get_tier_performance(db: Session = Depends(get_db)):
     """Get performance breakdown by signal tier"""
     try:
         calc = PerformanceCalculator(db)
@@ -77,8 +171,8 @@ async def get_tier_performance(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/performance/monthly")
-async def get_monthly_performance(db: Session = Depends(get_db)):
+@router.get("/performance/monthly", response_model=MonthlyPerformanceResponse)
+def get_monthly_performance(db: Session = Depends(get_db)):
     """Get monthly returns"""
     try:
         calc = PerformanceCalculator(db)
@@ -93,31 +187,14 @@ async def get_monthly_performance(db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-@router.get("/performance/trades")
-async def get_recent_trades(limit: int = 50, db: Session = Depends(get_db)):
+@router.get("/performance/trades", response_model=RecentTradesResponse)
+def get_recent_trades(limit: int = 50, db: Session = Depends(get_db)):
     """Get recent trades"""
     try:
         from backend.database.repositories.trade_repository import TradeRepository
         
         trade_repo = TradeRepository(db)
-        trades = trade_repo.get_closed_trades(limit)
-        
-        trades_data = []
-        for trade in trades:
-            trades_data.append({
-                'trade_id': trade.trade_id,
-                'symbol': trade.symbol,
-                'side': trade.side,
-                'entry_price': trade.entry_price,
-                'exit_price': trade.exit_price,
-                'quantity': trade.quantity,
-                'pnl': trade.pnl,
-                'pnl_percent': trade.pnl_percent,
-                'status': trade.status,
-                'close_reason': trade.close_reason,
-                'entry_time': trade.entry_time.isoformat() if trade.entry_time else None,
-                'exit_time': trade.exit_time.isoformat() if trade.exit_time else None
-            })
+        trades_data = trade_repo.get_closed_trade_rows(limit)
         
         return {
             'status': 'success',
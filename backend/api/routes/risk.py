@@ -5,31 +5,36 @@ from fastapi import APIRouter, HTTPException
 from typing import Dict, Any, List
 import logging
 from datetime import datetime, timedelta
-import random
+import numpy as np
+
+from backend.infra.cache import MOCK_DATA_CACHE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_rng = np.random.default_rng()
+
+# Static sector exposure, shared by every payload (never mutated)
+_EXPOSURE_BREAKDOWN = (
+    {"sector": "Technology", "exposure": 35.2, "risk": "MEDIUM"},
+    {"sector": "Healthcare", "exposure": 22.1, "risk": "LOW"},
+    {"sector": "Finance", "exposure": 18.5, "risk": "HIGH"},
+    {"sector": "Energy", "exposure": 12.3, "risk": "MEDIUM"},
+    {"sector": "Consumer", "exposure": 11.9, "risk": "LOW"}
+)
+
 def generate_risk_data():
     """Generate mock risk metrics"""
-    # Risk history
-    risk_history = []
-    for i in range(24):  # Last 24 hours
-        time = (datetime.now() - timedelta(hours=23-i)).strftime("%H:%M")
-        risk_history.append({
-            "time": time,
-            "portfolio": round(random.uniform(0.1, 0.5), 2),
-            "market": round(random.uniform(0.2, 0.8), 2),
-            "position": round(random.uniform(0.1, 0.4), 2)
-        })
+    now = datetime.now()
     
-    # Exposure breakdown
-    exposure_breakdown = [
-        {"sector": "Technology", "exposure": 35.2, "risk": "MEDIUM"},
-        {"sector": "Healthcare", "exposure": 22.1, "risk": "LOW"},
-        {"sector": "Finance", "exposure": 18.5, "risk": "HIGH"},
-        {"sector": "Energy", "exposure": 12.3, "risk": "MEDIUM"},
-        {"sector": "Consumer", "exposure": 11.9, "risk": "LOW"}
+    # Risk history for the last 24 hours, each series drawn in one call
+    times = [(now - timedelta(hours=23-i)).strftime("%H:%M") for i in range(24)]
+    portfolio = np.round(_rng.uniform(0.1, 0.5, 24), 2).tolist()
+    market = np.round(_rng.uniform(0.2, 0.8, 24), 2).tolist()
+    position = np.round(_rng.uniform(0.1, 0.4, 24), 2).tolist()
+    risk_history = [
+        {"time": time, "portfolio": p, "market": m, "position": pos}
+        for time, p, m, pos in zip(times, portfolio, market, position)
     ]
     
     # Risk alerts
@@ -37,17 +42,17 @@ def generate_risk_data():
         {
             "severity": "HIGH",
             "message": "Portfolio concentration in NVDA exceeds 15%",
-            "timestamp": (datetime.now() - timedelta(minutes=15)).isoformat()
+            "timestamp": (now - timedelta(minutes=15)).isoformat()
         },
         {
             "severity": "MEDIUM",
             "message": "Market volatility increasing - VIX above 25",
-            "timestamp": (datetime.now() - timedelta(minutes=45)).isoformat()
+            "timestamp": (now - timedelta(minutes=45)).isoformat()
         },
         {
             "severity": "LOW",
             "message": "Correlation risk detected in tech positions",
-            "timestamp": (datetime.now() - timedelta(hours=2)).isoformat()
+            "timestamp": (now - timedelta(hours=2)).isoformat()
         }
     ]
     
@@ -57,7 +62,7 @@ def generate_risk_data():
         "max_drawdown": -12.3,
         "risk_alerts": len([a for a in alerts if a["severity"] == "HIGH"]),
         "risk_history": risk_history,
-        "exposure_breakdown": exposure_breakdown,
+        "exposure_breakdown": _EXPOSURE_BREAKDOWN,
         "alerts": alerts
     }
 
@@ -65,7 +70,7 @@ def generate_risk_data():
 async def get_risk_metrics():
     """Get risk metrics"""
     try:
-        data = generate_risk_data()
+        data = MOCK_DATA_CACHE.get_or_set("risk", generate_risk_data)
         
         logger.info("Retrieved risk metrics")
         
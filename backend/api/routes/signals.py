@@ -2,47 +2,80 @@
 Trading Signals API Routes
 """
 from fastapi import APIRouter, HTTPException
-from typing import Dict, Any, List
+from typing import Dict, Any, List, Tuple
+from collections import Counter
 import logging
 from datetime import datetime, timedelta
 import random
+import numpy as np
+
+from backend.infra.cache import MOCK_SIGNALS_CACHE
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
 
+_rng = np.random.default_rng()
+
+_SYMBOLS = ["NVDA", "TSLA", "AAPL", "AMD", "META", "GOOGL", "MSFT", "AMZN"]
+_TIERS = ["PLATINUM", "GOLD", "SILVER", "BRONZE"]
+_ACTIONS = ["LONG", "SHORT"]
+_MODULES = np.array(["pattern_scorer", "sentiment_analyzer", "market_scanner"])
+
 def generate_mock_signals():
     """Generate mock trading signals for demo"""
-    symbols = ["NVDA", "TSLA", "AAPL", "AMD", "META", "GOOGL", "MSFT", "AMZN"]
-    tiers = ["PLATINUM", "GOLD", "SILVER", "BRONZE"]
-    actions = ["LONG", "SHORT"]
+    now = datetime.now()
+    n = 8
     
-    signals = []
-    for i in range(8):
-        signals.append({
-            "id": f"sig_{i+1}",
-            "symbol": random.choice(symbols),
-            "action": random.choice(actions),
-            "tier": random.choice(tiers),
-            "confidence": round(random.uniform(0.6, 0.95), 2),
-            "entry_price": round(random.uniform(100, 500), 2),
-            "stop_loss": round(random.uniform(95, 495), 2),
-            "take_profit": round(random.uniform(105, 520), 2),
-            "timestamp": (datetime.now() - timedelta(minutes=random.randint(0, 60))).isoformat(),
-            "modules_triggered": random.sample(
-                ["pattern_scorer", "sentiment_analyzer", "market_scanner"], 
-                k=random.randint(1, 3)
-            ),
-            "risk_score": round(random.uniform(0.1, 0.5), 2),
-            "position_size": random.choice([100, 200, 300, 500])
-        })
+    # Draw every field for the batch in one call each
+    symbols = _rng.choice(_SYMBOLS, n).tolist()
+    actions = _rng.choice(_ACTIONS, n).tolist()
+    tiers = _rng.choice(_TIERS, n).tolist()
+    confidences = np.round(_rng.uniform(0.6, 0.95, n), 2).tolist()
+    entry_prices = np.round(_rng.uniform(100, 500, n), 2).tolist()
+    stop_losses = np.round(_rng.uniform(95, 495, n), 2).tolist()
+    take_profits = np.round(_rng.uniform(105, 520, n), 2).tolist()
+    minutes_ago = _rng.integers(0, 61, n)
+    risk_scores = np.round(_rng.uniform(0.1, 0.5, n), 2).tolist()
+    position_sizes = _rng.choice([100, 200, 300, 500], n).tolist()
+    
+    # One shuffled row of modules per signal; each signal keeps its first k
+    module_orders = _rng.permuted(np.tile(_MODULES, (n, 1)), axis=1)
+    module_counts = _rng.integers(1, len(_MODULES) + 1, n)
     
-    return sorted(signals, key=lambda x: x["timestamp"], reverse=True)
+    # Newest first: fewest minutes ago first (stable, like sorting the timestamps)
+    return [
+        {
+            "id": f"sig_{i+1}",
+            "symbol": symbols[i],
+            "action": actions[i],
+            "tier": tiers[i],
+            "confidence": confidences[i],
+            "entry_price": entry_prices[i],
+            "stop_loss": stop_losses[i],
+            "take_profit": take_profits[i],
+            "timestamp": (now - timedelta(minutes=int(minutes_ago[i]))).isoformat(),
+            "modules_triggered": module_orders[i, :module_counts[i]].tolist(),
+            "risk_score": risk_scores[i],
+            "position_size": position_sizes[i]
+        }
+        for i in np.argsort(minutes_ago, kind="stable").tolist()
+    ]
+
+def _build_mock_bundle() -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Generate mock signals along with an id -> signal index"""
+    signals = generate_mock_signals()
+    return signals, {s["id"]: s for s in signals}
+
+def _mock_bundle() -> Tuple[List[Dict[str, Any]], Dict[str, Dict[str, Any]]]:
+    """Current mock signals and their index, regenerated every 30s"""
+    return MOCK_SIGNALS_CACHE.get_or_set("signals", _build_mock_bundle)
 
 @router.get("/signals")
 async def get_signals():
     """Get current trading signals"""
     try:
-        signals = generate_mock_signals()
+        signals, _ = _mock_bundle()
+        tier_counts = Counter(s["tier"] for s in signals)
         
         logger.info(f"Retrieved {len(signals)} signals")
         
@@ -51,10 +84,10 @@ async def get_signals():
             "data": signals,
             "meta": {
                 "total": len(signals),
-                "platinum": sum(1 for s in signals if s["tier"] == "PLATINUM"),
-                "gold": sum(1 for s in signals if s["tier"] == "GOLD"),
-                "silver": sum(1 for s in signals if s["tier"] == "SILVER"),
-                "bronze": sum(1 for s in signals if s["tier"] == "BRONZE")
+                "platinum": tier_counts["PLATINUM"],
+                "gold": tier_counts["GOLD"],
+                "silver": tier_counts["SILVER"],
+                "bronze": tier_counts["BRONZE"]
             }
         }
     except Exception as e:
@@ -65,13 +98,14 @@ async def get_signals():
 async def get_signal_details(signal_id: str):
     """Get detailed info about a specific signal"""
     try:
-        signals = generate_mock_signals()
-        signal = next((s for s in signals if s["id"] == signal_id), None)
+        _, signals_by_id = _mock_bundle()
+        signal = signals_by_id.get(signal_id)
         
         if not signal:
             raise HTTPException(status_code=404, detail=f"Signal {signal_id} not found")
         
-        # Add more detailed info
+        # Add more detailed info (on a copy; the cached signal is shared)
+        signal = dict(signal)
         signal["analysis"] = {
             "technical": {
                 "rsi": round(random.uniform(30, 70), 2),
@@ -100,6 +134,7 @@ async def execute_signal(signal_id: str):
     """Execute a trading signal"""
     try:
         logger.info(f"Executing signal {signal_id}")
+        now = datetime.now()
         
         # In production, this would trigger actual trading
         return {
@@ -107,8 +142,8 @@ async def execute_signal(signal_id: str):
             "data": {
                 "signal_id": signal_id,
                 "execution_status": "pending",
-                "order_id": f"ord_{datetime.now().timestamp()}",
-                "timestamp": datetime.now().isoformat()
+                "order_id": f"ord_{now.timestamp()}",
+                "timestamp": now.isoformat()
             }
         }
     except Exception as e:
@@ -3,8 +3,9 @@ Enhanced Signals Route with Real-time Broadcasting
 """
 from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import Dict, List, Optional, Set
 from datetime import datetime, timedelta
+import asyncio
 import logging
 
 from backend.database import get_db
@@ -15,9 +16,12 @@ from backend.api.routes.websocket import broadcast_signal
 router = APIRouter(tags=["signals"])
 logger = logging.getLogger(__name__)
 
+# Strong references to in-flight broadcasts so they aren't garbage collected mid-send
+_BROADCAST_TASKS: Set[asyncio.Task] = set()
+
 
 @router.get("/signals")
-async def get_signals(
+def get_signals(
     tier: Optional[str] = None,
     limit: int = 100,
     db: Session = Depends(get_db)
@@ -26,29 +30,11 @@ async def get_signals(
     try:
         signal_repo = SignalRepository(db)
         
+        # Column rows go straight to the response; datetimes are encoded on serialization
         if tier:
-            signals = signal_repo.get_by_tier(tier, limit)
+            signals_data = signal_repo.get_tier_signal_rows(tier, limit)
         else:
-            signals = signal_repo.get_active_signals(limit)
-        
-        # Convert to dict
-        signals_data = []
-        for signal in signals:
-            signals_data.append({
-                'signal_id': signal.signal_id,
-                'symbol': signal.symbol,
-                'action': signal.action,
-                'tier': signal.tier,
-                'confidence': signal.confidence,
-                'entry_price': signal.entry_price,
-                'target_price': signal.target_price,
-                'stop_loss': signal.stop_loss,
-                'rsi': signal.rsi,
-                'volume_ratio': signal.volume_ratio,
-                'reasoning': signal.reasoning,
-                'created_at': signal.created_at.isoformat() if signal.created_at else None,
-                'status': signal.status
-            })
+            signals_data = signal_repo.get_active_signal_rows(limit)
         
         # Get tier distribution
         tier_dist = signal_repo.get_tier_distribution()
@@ -67,7 +53,7 @@ async def get_signals(
 
 
 @router.get("/signals/{signal_id}")
-async def get_signal_details(signal_id: str, db: Session = Depends(get_db)):
+def get_signal_details(signal_id: str, db: Session = Depends(get_db)):
     """Get detailed information about a specific signal"""
     try:
         signal_repo = SignalRepository(db)
@@ -109,24 +95,44 @@ async def get_signal_details(signal_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _mark_executed(signal_repo: SignalRepository, signal_id: str) -> Signal:
+    """Validate that a signal can be executed and mark it EXECUTED"""
+    signal = signal_repo.get_by_id(signal_id)
+    
+    if not signal:
+        raise HTTPException(status_code=404, detail="Signal not found")
+    
+    if signal.status != 'ACTIVE':
+        raise HTTPException(status_code=400, detail=f"Signal is {signal.status}, cannot execute")
+    
+    # Update signal status
+    return signal_repo.update_status(signal_id, 'EXECUTED')
+
+
+async def _broadcast_quietly(payload: Dict):
+    """Broadcast a signal update, logging rather than raising on failure"""
+    try:
+        await broadcast_signal(payload)
+    except Exception as e:
+        logger.error(f"Error broadcasting signal {payload.get('signal_id')}: {e}")
+
+
+def _broadcast_in_background(payload: Dict):
+    """Schedule a signal broadcast without waiting for it to reach clients"""
+    task = asyncio.create_task(_broadcast_quietly(payload))
+    _BROADCAST_TASKS.add(task)
+    task.add_done_callback(_BROADCAST_TASKS.discard)
+
+
 @router.post("/signals/{signal_id}/execute")
 async def execute_signal(signal_id: str, db: Session = Depends(get_db)):
     """Execute a trading signal"""
     try:
-        signal_repo = SignalRepository(db)
-        signal = signal_repo.get_by_id(signal_id)
-        
-        if not signal:
-            raise HTTPException(status_code=404, detail="Signal not found")
+        # Database work runs in a worker thread; only the broadcast needs the event loop
+        signal = await asyncio.to_thread(_mark_executed, SignalRepository(db), signal_id)
         
-        if signal.status != 'ACTIVE':
-            raise HTTPException(status_code=400, detail=f"Signal is {signal.status}, cannot execute")
-        
-        # Update signal status
-        signal = signal_repo.update_status(signal_id, 'EXECUTED')
-        
-        # Broadcast execution
-        await broadcast_signal({
+        # Broadcast execution; clients get the response without waiting on websocket sends
+        _broadcast_in_background({
             'signal_id': signal.signal_id,
             'symbol': signal.symbol,
             'action': 'executed',
@@ -149,27 +155,23 @@ async def execute_signal(signal_id: str, db: Session = Depends(get_db)):
 
 
 @router.get("/signals/recent/summary")
-async def get_recent_signals_summary(hours: int = 24, db: Session = Depends(get_db)):
+def get_recent_signals_summary(hours: int = 24, db: Session = Depends(get_db)):
     """Get summary of recent signals"""
     try:
         signal_repo = SignalRepository(db)
-        signals = signal_repo.get_recent(hours=hours)
-        
-        # Calculate summary stats
-        tier_counts = {}
-        total_confidence = 0
+        aggregates = signal_repo.get_recent_aggregates(hours=hours)
         
-        for signal in signals:
-            tier = signal.tier
-            tier_counts[tier] = tier_counts.get(tier, 0) + 1
-            total_confidence += signal.confidence
+        # Combine per-tier aggregates; overall average is the count-weighted mean
+        tier_counts = {tier: count for tier, count, _ in aggregates}
+        total_signals = sum(tier_counts.values())
+        total_confidence = sum(count * (avg or 0) for _, count, avg in aggregates)
         
-        avg_confidence = total_confidence / len(signals) if signals else 0
+        avg_confidence = total_confidence / total_signals if total_signals else 0
         
         return {
             'status': 'success',
             'data': {
-                'total_signals': len(signals),
+                'total_signals': total_signals,
                 'tier_breakdown': tier_counts,
                 'average_confidence': round(avg_confidence, 2),
                 'timeframe_hours': hours
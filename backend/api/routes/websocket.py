@@ -3,54 +3,123 @@ WebSocket Handler for Real-time Updates
 Broadcasts signals, trades, and system status to connected clients
 """
 from fastapi import APIRouter, WebSocket, WebSocketDisconnect
-from typing import List, Dict
+from typing import List, Dict, Set, Tuple
 import asyncio
-import json
 import logging
+import orjson
 from datetime import datetime
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
 
 
+# Per-client outbound queue bound; a client this far behind is disconnected
+SEND_QUEUE_SIZE = 256
+
+# Snapshot message types where only the newest queued message matters
+_LATEST_ONLY_TYPES = frozenset({"market_update", "bot_status"})
+
+# Strong references to in-flight slow-client close tasks so they are not collected mid-run
+_CLOSE_TASKS: Set[asyncio.Task] = set()
+
+
+def _coalesce(batch: List[Tuple[str, str]]) -> List[str]:
+    """Drop queued snapshot messages superseded by a newer one of the same type"""
+    last_index = {
+        msg_type: i for i, (msg_type, _) in enumerate(batch) if msg_type in _LATEST_ONLY_TYPES
+    }
+    return [
+        payload for i, (msg_type, payload) in enumerate(batch)
+        if msg_type not in _LATEST_ONLY_TYPES or last_index[msg_type] == i
+    ]
+
+
+async def _close_quietly(websocket: WebSocket, code: int):
+    """Close a client socket, logging rather than raising on failure"""
+    try:
+        await websocket.close(code=code)
+    except Exception as e:
+        logger.debug("Closing slow client failed: %r", e)
+
+
 class ConnectionManager:
-    """Manages WebSocket connections"""
+    """
+    Manages WebSocket connections
+    
+    Each client gets a bounded outbound queue drained by its own writer task,
+    so a slow client never stalls broadcasts to the others.
+    """
     
     def __init__(self):
-        self.active_connections: List[WebSocket] = []
+        self.active_connections: Dict[WebSocket, asyncio.Queue] = {}
+        self._writers: Dict[WebSocket, asyncio.Task] = {}
     
     async def connect(self, websocket: WebSocket):
         """Accept new WebSocket connection"""
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info(f"Client connected. Total connections: {len(self.active_connections)}")
+        queue = asyncio.Queue(maxsize=SEND_QUEUE_SIZE)
+        self.active_connections[websocket] = queue
+        self._writers[websocket] = asyncio.create_task(self._writer(websocket, queue))
+        logger.info("Client connected. Total connections: %d", len(self.active_connections))
     
     def disconnect(self, websocket: WebSocket):
         """Remove WebSocket connection"""
-        self.active_connections.remove(websocket)
-        logger.info(f"Client disconnected. Total connections: {len(self.active_connections)}")
+        if self.active_connections.pop(websocket, None) is None:
+            return
+        writer = self._writers.pop(websocket, None)
+        if writer is not None and writer is not asyncio.current_task():
+            writer.cancel()
+        logger.info("Client disconnected. Total connections: %d", len(self.active_connections))
     
-    async def send_personal_message(self, message: Dict, websocket: WebSocket):
-        """Send message to specific client"""
+    async def _writer(self, websocket: WebSocket, queue: asyncio.Queue):
+        """Send queued messages to one client, coalescing whatever has piled up"""
         try:
-            await websocket.send_json(message)
+            while True:
+                batch = [await queue.get()]
+                while not queue.empty():
+                    batch.append(queue.get_nowait())
+                
+                for payload in _coalesce(batch):
+                    await websocket.send_text(payload)
+        except asyncio.CancelledError:
+            raise
         except Exception as e:
-            logger.error(f"Error sending personal message: {e}")
+            # The writer exits here, so this logs once per dead client rather
+            # than once per broadcast
+            logger.warning("Send to client failed, disconnecting: %r", e)
+            self.disconnect(websocket)
+    
+    def _enqueue(self, websocket: WebSocket, queue: asyncio.Queue, msg_type: str, payload: str):
+        """Queue an encoded message for a client, dropping the client if it is too far behind"""
+        try:
+            queue.put_nowait((msg_type, payload))
+        except asyncio.QueueFull:
+            logger.warning("Client send queue full, disconnecting slow client")
+            self.disconnect(websocket)
+            task = asyncio.create_task(_close_quietly(websocket, 1013))
+            _CLOSE_TASKS.add(task)
+            task.add_done_callback(_CLOSE_TASKS.discard)
+    
+    async def send_personal_message(self, message: Dict, websocket: WebSocket):
+        """Send message to specific client"""
+        queue = self.active_connections.get(websocket)
+        if queue is None:
+            logger.error("Error sending personal message: client not connected")
+            return
+        self._enqueue(websocket, queue, message.get("type"), orjson.dumps(message).decode())
     
     async def broadcast(self, message: Dict):
         """Broadcast message to all connected clients"""
-        disconnected = []
-        for connection in self.active_connections:
-            try:
-                await connection.send_json(message)
-            except Exception as e:
-                logger.error(f"Error broadcasting to client: {e}")
-                disconnected.append(connection)
+        if not self.active_connections:
+            return
         
-        # Clean up disconnected clients
-        for conn in disconnected:
-            if conn in self.active_connections:
-                self.active_connections.remove(conn)
+        # Encode once (text frames; the dashboard JSON.parses them) and hand the
+        # payload to every client's queue without waiting on any send.
+        # orjson writes datetime timestamps directly, in isoformat() form
+        msg_type = message.get("type")
+        payload = orjson.dumps(message).decode()
+        for websocket, queue in list(self.active_connections.items()):
+            self._enqueue(websocket, queue, msg_type, payload)
 
 
 # Global connection manager
@@ -70,82 +139,76 @@ async def websocket_endpoint(websocket: WebSocket):
         await manager.send_personal_message({
             "type": "connected",
             "message": "Connected to STEALTH Bot live feed",
-            "timestamp": datetime.utcnow().isoformat()
+            "timestamp": datetime.utcnow()
         }, websocket)
         
         # Keep connection alive and handle incoming messages
         while True:
             try:
-                # Wait for messages from client
+                # Wait for messages from client; replies below are only queued
+                # for the writer task, so a burst is handled without awaiting sends
                 data = await websocket.receive_text()
-                message = json.loads(data)
+                message = orjson.loads(data)
+                msg_type = message.get("type")
                 
                 # Handle different message types
-                if message.get("type") == "ping":
+                if msg_type == "ping":
                     await manager.send_personal_message({
                         "type": "pong",
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": datetime.utcnow()
                     }, websocket)
                 
-                elif message.get("type") == "subscribe":
+                elif msg_type == "subscribe":
                     # Client subscribing to specific channels
                     channels = message.get("channels", [])
                     await manager.send_personal_message({
                         "type": "subscribed",
                         "channels": channels,
-                        "timestamp": datetime.utcnow().isoformat()
+                        "timestamp": datetime.utcnow()
                     }, websocket)
                 
             except WebSocketDisconnect:
                 break
             except Exception as e:
-                logger.error(f"Error in WebSocket loop: {e}")
+                logger.error("Error in WebSocket loop: %s", e)
                 break
     
     finally:
         manager.disconnect(websocket)
 
 
-async def broadcast_signal(signal: Dict):
-    """Broadcast new signal to all clients"""
+async def _broadcast_event(msg_type: str, data: Dict):
+    """Wrap data in a typed, timestamped event and broadcast it"""
+    # Skip building the event at all when nobody is listening
+    if not manager.active_connections:
+        return
     await manager.broadcast({
-        "type": "signal",
-        "data": signal,
-        "timestamp": datetime.utcnow().isoformat()
+        "type": msg_type,
+        "data": data,
+        "timestamp": datetime.utcnow()
     })
 
 
+async def broadcast_signal(signal: Dict):
+    """Broadcast new signal to all clients"""
+    await _broadcast_event("signal", signal)
+
+
 async def broadcast_trade(trade: Dict):
     """Broadcast new trade to all clients"""
-    await manager.broadcast({
-        "type": "trade",
-        "data": trade,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    await _broadcast_event("trade", trade)
 
 
 async def broadcast_bot_status(status: Dict):
     """Broadcast bot status update"""
-    await manager.broadcast({
-        "type": "bot_status",
-        "data": status,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    await _broadcast_event("bot_status", status)
 
 
 async def broadcast_market_update(market_data: Dict):
     """Broadcast market data update"""
-    await manager.broadcast({
-        "type": "market_update",
-        "data": market_data,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    await _broadcast_event("market_update", market_data)
 
 
 async def broadcast_alert(alert: Dict):
     """Broadcast system alert"""
-    await manager.broadcast({
-        "type": "alert",
-        "data": alert,
-        "timestamp": datetime.utcnow().isoformat()
-    })
+    await _broadcast_event("alert", alert)
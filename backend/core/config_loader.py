@@ -3,20 +3,42 @@ Configuration loader and management for STEALTH Bot
 """
 import os
 import yaml
-from typing import Dict, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 from pathlib import Path
 
 
-def load_config(path: str = 'config/config.yml') -> Dict[str, Any]:
+# Shared read-only stand-in for modules with no configuration
+_EMPTY_MODULE_CONFIG: Mapping[str, Any] = MappingProxyType({})
+
+
+def load_config(path: str = 'config/config.yml') -> Mapping[str, Any]:
     """
     Load configuration from YAML file and merge with defaults.
     
+    Results are cached per (path, file mtime), so an edited file is picked
+    up on the next call without re-parsing an unchanged one. The returned
+    configuration is shared and read-only (nested mappings are
+    MappingProxyType).
+    
     Args:
         path: Path to configuration file
         
     Returns:
-        Merged configuration dictionary
+        Merged configuration mapping
     """
+    abs_path = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(abs_path).st_mtime_ns
+    except OSError:
+        mtime_ns = 0
+    return _load_config_cached(abs_path, mtime_ns)
+
+
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Mapping[str, Any]:
+    """Load, merge, validate and freeze the configuration at path (cached by load_config)"""
     # Default configuration
     defaults = {
         'trading': {
@@ -128,13 +150,29 @@ def load_config(path: str = 'config/config.yml') -> Dict[str, Any]:
     # Validate configuration
     config = validate_config(config)
     
-    return config
+    # Freeze each section, then precompute module lookups for
+    # get_module_config / is_module_enabled
+    frozen = {key: _freeze(value) for key, value in config.items()}
+    index_modules(frozen)
+    
+    return MappingProxyType(frozen)
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively wrap dicts in read-only MappingProxyType views"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    return value
 
 
 def deep_merge(base: Dict, updates: Dict) -> Dict:
     """
     Recursively merge two dictionaries.
     
+    Walks the updates with an explicit stack instead of recursing. Only the
+    nested dicts that an update actually descends into are copied, so base
+    is never mutated and untouched sections are shared, not duplicated.
+    
     Args:
         base: Base dictionary
         updates: Updates to apply
@@ -143,12 +181,17 @@ def deep_merge(base: Dict, updates: Dict) -> Dict:
         Merged dictionary
     """
     result = base.copy()
+    stack = [(result, updates)]
     
-    for key, value in updates.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    while stack:
+        target, source = stack.pop()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, dict) and isinstance(value, dict):
+                target[key] = current = current.copy()
+                stack.append((current, value))
+            else:
+                target[key] = value
     
     return result
 
@@ -179,7 +222,31 @@ def validate_config(config: Dict) -> Dict:
     return config
 
 
-def get_module_config(config: Dict, module_name: str) -> Dict:
+def index_modules(config: Dict) -> Dict:
+    """
+    Precompute the enabled-module set and a read-only module config view.
+    
+    Stored under '_enabled_modules' and '_module_configs'; configs without
+    them (e.g. hand-built dicts) fall back to walking 'modules'.
+    
+    Args:
+        config: Configuration dictionary
+    
+    Returns:
+        The same configuration, indexed in place
+    """
+    modules = config.get('modules') or {}
+    config['_enabled_modules'] = frozenset(
+        name for name, module_config in modules.items()
+        if isinstance(module_config, Mapping) and module_config.get('enabled', False)
+    )
+    config['_module_configs'] = (
+        modules if isinstance(modules, MappingProxyType) else MappingProxyType(modules)
+    )
+    return config
+
+
+def get_module_config(config: Dict, module_name: str) -> Mapping[str, Any]:
     """
     Get configuration for a specific module.
     
@@ -188,9 +255,12 @@ def get_module_config(config: Dict, module_name: str) -> Dict:
         module_name: Name of the module
         
     Returns:
-        Module configuration dictionary
+        Module configuration mapping (shared; do not mutate)
     """
-    return config.get('modules', {}).get(module_name, {})
+    module_configs = config.get('_module_configs')
+    if module_configs is None:
+        module_configs = config.get('modules', {})
+    return module_configs.get(module_name, _EMPTY_MODULE_CONFIG)
 
 
 def is_module_enabled(config: Dict, module_name: str) -> bool:
@@ -204,5 +274,7 @@ def is_module_enabled(config: Dict, module_name: str) -> bool:
     Returns:
         True if module is enabled, False otherwise
     """
-    module_config = get_module_config(config, module_name)
-    return module_config.get('enabled', False)
\ No newline at end of file
+    enabled_modules = config.get('_enabled_modules')
+    if enabled_modules is None:
+        return get_module_config(config, module_name).get('enabled', False)
+    return module_name in enabled_modules
\ No newline at end of file
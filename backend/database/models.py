@@ -3,7 +3,7 @@ SQLAlchemy Database Models
 All persistence models for STEALTH Bot
 """
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, Text, ForeignKey
+from sqlalchemy import Column, Integer, String, Float, Boolean, DateTime, JSON, Text, ForeignKey, Index, text
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
 
@@ -45,6 +45,19 @@ class Signal(Base):
     
     # Relationships
     trade = relationship("Trade", back_populates="signal", uselist=False)
+    
+    __table_args__ = (
+        # Newest-first listings by status / symbol / tier+status
+        Index('ix_signals_status_created', 'status', 'created_at'),
+        Index('ix_signals_symbol_created', 'symbol', 'created_at'),
+        Index('ix_signals_tier_status_created', 'tier', 'status', 'created_at'),
+        # Only active signals can expire, so index just those by expiry
+        Index(
+            'ix_signals_active_expiry', 'expires_at',
+            sqlite_where=text("status = 'ACTIVE'"),
+            postgresql_where=text("status = 'ACTIVE'")
+        ),
+    )
 
 
 class Trade(Base):
@@ -65,7 +78,7 @@ class Trade(Base):
     
     # Exit details
     exit_price = Column(Float)
-    exit_time = Column(DateTime)
+    exit_time = Column(DateTime, index=True)  # Recent closed trades walk this index newest-first
     stop_loss = Column(Float)
     take_profit = Column(Float)
     
@@ -85,6 +98,11 @@ class Trade(Base):
     
     # Relationships
     signal = relationship("Signal", back_populates="trade")
+    
+    __table_args__ = (
+        # A symbol's trades, newest entry first
+        Index('ix_trades_symbol_entry', 'symbol', 'entry_time'),
+    )
 
 
 class PerformanceLog(Base):
@@ -1,13 +1,38 @@
 """
 Signal Repository - Data access layer for signals
 """
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, and_
+from sqlalchemy import bindparam, desc, and_, insert, select, update
 
 from backend.database.models import Signal
 
+# Columns returned by the signal list endpoints
+SIGNAL_LIST_COLUMNS = (
+    Signal.signal_id, Signal.symbol, Signal.action, Signal.tier, Signal.confidence,
+    Signal.entry_price, Signal.target_price, Signal.stop_loss, Signal.rsi,
+    Signal.volume_ratio, Signal.reasoning, Signal.created_at, Signal.status
+)
+
+# Hot list queries built once; only the bound values change per call, so
+# each execution skips Query construction and hits the compiled cache
+_ACTIVE_FILTER = (Signal.status == 'ACTIVE', Signal.expires_at > bindparam('now'))
+_NEWEST_FIRST = desc(Signal.created_at)
+
+_ACTIVE_SIGNALS_STMT = select(Signal).where(*_ACTIVE_FILTER).order_by(
+    _NEWEST_FIRST
+).limit(bindparam('limit'))
+
+_ACTIVE_SIGNAL_ROWS_STMT = select(*SIGNAL_LIST_COLUMNS).where(*_ACTIVE_FILTER).order_by(
+    _NEWEST_FIRST
+).limit(bindparam('limit'))
+
+_TIER_SIGNAL_ROWS_STMT = select(*SIGNAL_LIST_COLUMNS).where(
+    Signal.tier == bindparam('tier'),
+    Signal.status == 'ACTIVE'
+).order_by(_NEWEST_FIRST).limit(bindparam('limit'))
+
 
 class SignalRepository:
     """Repository for Signal operations"""
@@ -20,19 +45,32 @@ class SignalRepository:
         signal = Signal(**signal_data)
         self.db.add(signal)
         self.db.commit()
-        self.db.refresh(signal)
         return signal
     
+    def create_many(self, rows: List[Dict]) -> int:
+        """Insert many signals in one executemany and a single commit"""
+        if not rows:
+            return 0
+        self.db.execute(insert(Signal), rows)
+        self.db.commit()
+        return len(rows)
+    
     def get_by_id(self, signal_id: str) -> Optional[Signal]:
         """Get signal by ID"""
         return self.db.query(Signal).filter(Signal.signal_id == signal_id).first()
     
     def get_active_signals(self, limit: int = 100) -> List[Signal]:
         """Get all active signals"""
-        return self.db.query(Signal).filter(
-            Signal.status == 'ACTIVE',
-            Signal.expires_at > datetime.utcnow()
-        ).order_by(desc(Signal.created_at)).limit(limit).all()
+        return self.db.execute(
+            _ACTIVE_SIGNALS_STMT, {'now': datetime.utcnow(), 'limit': limit}
+        ).scalars().all()
+    
+    def get_active_signal_rows(self, limit: int = 100) -> List[Dict]:
+        """Get active signals as plain dicts of SIGNAL_LIST_COLUMNS (no ORM hydration)"""
+        rows = self.db.execute(
+            _ACTIVE_SIGNAL_ROWS_STMT, {'now': datetime.utcnow(), 'limit': limit}
+        ).mappings()
+        return [dict(row) for row in rows]
     
     def get_by_symbol(self, symbol: str, limit: int = 50) -> List[Signal]:
         """Get signals for a specific symbol"""
@@ -47,6 +85,13 @@ class SignalRepository:
             Signal.status == 'ACTIVE'
         ).order_by(desc(Signal.created_at)).limit(limit).all()
     
+    def get_tier_signal_rows(self, tier: str, limit: int = 100) -> List[Dict]:
+        """Get active signals of a tier as plain dicts of SIGNAL_LIST_COLUMNS"""
+        rows = self.db.execute(
+            _TIER_SIGNAL_ROWS_STMT, {'tier': tier, 'limit': limit}
+        ).mappings()
+        return [dict(row) for row in rows]
+    
     def get_recent(self, hours: int = 24, limit: int = 200) -> List[Signal]:
         """Get recent signals within timeframe"""
         cutoff = datetime.utcnow() - timedelta(hours=hours)
@@ -54,23 +99,34 @@ class SignalRepository:
             Signal.created_at >= cutoff
         ).order_by(desc(Signal.created_at)).limit(limit).all()
     
+    def get_recent_aggregates(self, hours: int = 24) -> List[Tuple[str, int, float]]:
+        """Get (tier, count, average confidence) for signals within timeframe"""
+        from sqlalchemy import func
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+        return self.db.query(
+            Signal.tier, func.count(Signal.id), func.avg(Signal.confidence)
+        ).filter(Signal.created_at >= cutoff).group_by(Signal.tier).all()
+    
     def update_status(self, signal_id: str, status: str) -> Optional[Signal]:
         """Update signal status"""
         signal = self.get_by_id(signal_id)
         if signal:
             signal.status = status
             self.db.commit()
-            self.db.refresh(signal)
         return signal
     
-    def expire_old_signals(self) -> int:
-        """Expire signals past their expiry time"""
-        count = self.db.query(Signal).filter(
+    def expire_old_signals(self) -> List[str]:
+        """Expire signals past their expiry time, returning the expired signal IDs"""
+        # One UPDATE ... RETURNING over the partial ix_signals_active_expiry index
+        stmt = update(Signal).where(
             Signal.status == 'ACTIVE',
             Signal.expires_at <= datetime.utcnow()
-        ).update({'status': 'EXPIRED'})
+        ).values(status='EXPIRED').returning(Signal.signal_id)
+        expired = list(self.db.execute(
+            stmt, execution_options={'synchronize_session': False}
+        ).scalars())
         self.db.commit()
-        return count
+        return expired
     
     def get_tier_distribution(self) -> Dict[str, int]:
         """Get count of signals by tier"""
@@ -4,9 +4,27 @@ Trade Repository - Data access layer for trades
 from typing import List, Optional, Dict
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import desc, func
+from sqlalchemy import case, desc, func, insert
+import numpy as np
 
 from backend.database.models import Trade
+from backend.infra.cache import PERFORMANCE_CACHE
+
+# Record layout for daily P&L series; arr['pnl'] is a contiguous float64 column
+DAILY_PNL_DTYPE = np.dtype([('date', 'datetime64[D]'), ('pnl', 'f8')])
+
+# Columns needed to summarize open positions
+OPEN_TRADE_COLUMNS = (
+    Trade.trade_id, Trade.symbol, Trade.quantity, Trade.entry_price,
+    Trade.position_size, Trade.stop_loss, Trade.take_profit
+)
+
+# Columns returned by the recent trades endpoint
+TRADE_LIST_COLUMNS = (
+    Trade.trade_id, Trade.symbol, Trade.side, Trade.entry_price, Trade.exit_price,
+    Trade.quantity, Trade.pnl, Trade.pnl_percent, Trade.status, Trade.close_reason,
+    Trade.entry_time, Trade.exit_time
+)
 
 
 class TradeRepository:
@@ -20,9 +38,18 @@ class TradeRepository:
         trade = Trade(**trade_data)
         self.db.add(trade)
         self.db.commit()
-        self.db.refresh(trade)
+        PERFORMANCE_CACHE.clear()
         return trade
     
+    def create_many(self, rows: List[Dict]) -> int:
+        """Insert many trades in one executemany and a single commit"""
+        if not rows:
+            return 0
+        self.db.execute(insert(Trade), rows)
+        self.db.commit()
+        PERFORMANCE_CACHE.clear()
+        return len(rows)
+    
     def get_by_id(self, trade_id: str) -> Optional[Trade]:
         """Get trade by ID"""
         return self.db.query(Trade).filter(Trade.trade_id == trade_id).first()
@@ -31,12 +58,24 @@ class TradeRepository:
         """Get all open trades"""
         return self.db.query(Trade).filter(Trade.status == 'OPEN').all()
     
+    def get_open_trade_rows(self) -> List[Dict]:
+        """Get open trades as plain dicts of OPEN_TRADE_COLUMNS (no ORM hydration)"""
+        rows = self.db.query(*OPEN_TRADE_COLUMNS).filter(Trade.status == 'OPEN').all()
+        return [dict(row._mapping) for row in rows]
+    
     def get_closed_trades(self, limit: int = 100) -> List[Trade]:
         """Get closed trades"""
         return self.db.query(Trade).filter(
             Trade.status.in_(['CLOSED', 'STOPPED'])
         ).order_by(desc(Trade.exit_time)).limit(limit).all()
     
+    def get_closed_trade_rows(self, limit: int = 100) -> List[Dict]:
+        """Get closed trades as plain dicts of TRADE_LIST_COLUMNS (no ORM hydration)"""
+        rows = self.db.query(*TRADE_LIST_COLUMNS).filter(
+            Trade.status.in_(['CLOSED', 'STOPPED'])
+        ).order_by(desc(Trade.exit_time)).limit(limit).all()
+        return [dict(row._mapping) for row in rows]
+    
     def get_by_symbol(self, symbol: str) -> List[Trade]:
         """Get trades for a specific symbol"""
         return self.db.query(Trade).filter(
@@ -51,7 +90,7 @@ class TradeRepository:
                 setattr(trade, key, value)
             trade.updated_at = datetime.utcnow()
             self.db.commit()
-            self.db.refresh(trade)
+            PERFORMANCE_CACHE.clear()
         return trade
     
     def close_trade(self, trade_id: str, exit_price: float, reason: str) -> Optional[Trade]:
@@ -72,18 +111,28 @@ class TradeRepository:
             trade.pnl_percent = (trade.pnl / trade.position_size) * 100
             
             self.db.commit()
-            self.db.refresh(trade)
+            PERFORMANCE_CACHE.clear()
         return trade
     
     def get_performance_stats(self, days: int = 30) -> Dict:
         """Get performance statistics"""
         cutoff = datetime.utcnow() - timedelta(days=days)
-        trades = self.db.query(Trade).filter(
+        is_win = Trade.pnl > 0
+        
+        # Aggregate in the database; one row comes back however many trades match
+        total, wins, losses, total_pnl, total_wins, total_losses = self.db.query(
+            func.count(Trade.id),
+            func.sum(case((is_win, 1), else_=0)),
+            func.sum(case((Trade.pnl <= 0, 1), else_=0)),
+            func.sum(Trade.pnl),
+            func.sum(case((is_win, Trade.pnl), else_=0)),
+            func.sum(case((Trade.pnl <= 0, Trade.pnl), else_=0))
+        ).filter(
             Trade.entry_time >= cutoff,
             Trade.status.in_(['CLOSED', 'STOPPED'])
-        ).all()
+        ).one()
         
-        if not trades:
+        if not total:
             return {
                 'total_trades': 0,
                 'winning_trades': 0,
@@ -95,38 +144,28 @@ class TradeRepository:
                 'profit_factor': 0.0
             }
         
-        winning_trades = [t for t in trades if t.pnl > 0]
-        losing_trades = [t for t in trades if t.pnl <= 0]
-        
-        total_pnl = sum(t.pnl for t in trades)
-        total_wins = sum(t.pnl for t in winning_trades) if winning_trades else 0
-        total_losses = abs(sum(t.pnl for t in losing_trades)) if losing_trades else 0
+        total_losses = abs(total_losses or 0)
         
         return {
-            'total_trades': len(trades),
-            'winning_trades': len(winning_trades),
-            'losing_trades': len(losing_trades),
+            'total_trades': total,
+            'winning_trades': wins,
+            'losing_trades': losses,
             'total_pnl': total_pnl,
-            'win_rate': (len(winning_trades) / len(trades)) * 100 if trades else 0,
-            'avg_win': total_wins / len(winning_trades) if winning_trades else 0,
-            'avg_loss': total_losses / len(losing_trades) if losing_trades else 0,
+            'win_rate': (wins / total) * 100,
+            'avg_win': total_wins / wins if wins else 0,
+            'avg_loss': total_losses / losses if losses else 0,
             'profit_factor': total_wins / total_losses if total_losses > 0 else 0
         }
     
-    def get_daily_pnl(self, days: int = 30) -> List[Dict]:
-        """Get daily P&L breakdown"""
+    def get_daily_pnl(self, days: int = 30) -> np.ndarray:
+        """Get daily P&L as a DAILY_PNL_DTYPE array, oldest day first"""
         cutoff = datetime.utcnow() - timedelta(days=days)
-        trades = self.db.query(Trade).filter(
+        date = func.date(Trade.exit_time).label('date')
+        
+        # Group by date in the database so one row comes back per day
+        rows = self.db.query(date, func.sum(Trade.pnl)).filter(
             Trade.exit_time >= cutoff,
             Trade.status.in_(['CLOSED', 'STOPPED'])
-        ).all()
-        
-        # Group by date
-        daily_pnl = {}
-        for trade in trades:
-            date = trade.exit_time.date()
-            if date not in daily_pnl:
-                daily_pnl[date] = 0.0
-            daily_pnl[date] += trade.pnl
+        ).group_by(date).order_by(date).all()
         
-        return [{'date': str(date), 'pnl': pnl} for date, pnl in sorted(daily_pnl.items())]
+        return np.array([(str(day), pnl or 0.0) for day, pnl in rows], dtype=DAILY_PNL_DTYPE)
\ No newline at end of file
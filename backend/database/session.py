@@ -1,7 +1,7 @@
 """
 Database Session Management
 """
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
 from sqlalchemy.pool import StaticPool
 from contextlib import contextmanager
@@ -18,19 +18,52 @@ DB_PATH = DB_DIR / "stealth_bot.db"
 # Use environment variable for database URL (supports PostgreSQL in production)
 DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{DB_PATH}")
 
+# Applied to every new connection of a file-backed SQLite database
+SQLITE_PRAGMAS = (
+    "journal_mode=WAL",
+    "synchronous=NORMAL",
+    "temp_store=MEMORY",
+    "mmap_size=268435456",  # 256 MiB
+    "cache_size=-64000",  # ~64 MB page cache
+)
+
 # Create engine
 if DATABASE_URL.startswith("sqlite"):
-    engine = create_engine(
-        DATABASE_URL,
-        connect_args={"check_same_thread": False},
-        poolclass=StaticPool
-    )
+    # Route handlers run in FastAPI's threadpool, so a file database gets a real
+    # connection pool (one connection per concurrent session); only in-memory
+    # databases need StaticPool to share their single connection
+    in_memory = DATABASE_URL in ("sqlite://", "sqlite:///:memory:")
+    if in_memory:
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            poolclass=StaticPool
+        )
+    else:
+        engine = create_engine(
+            DATABASE_URL,
+            connect_args={"check_same_thread": False},
+            pool_size=10,
+            max_overflow=20,
+            pool_recycle=3600
+        )
+        
+        @event.listens_for(engine, "connect")
+        def _set_sqlite_pragmas(dbapi_connection, _connection_record):
+            """Apply SQLITE_PRAGMAS to a new DBAPI connection"""
+            # WAL lets readers run alongside the writer; synchronous=NORMAL only
+            # risks the last commits on power loss, not on an application crash
+            cursor = dbapi_connection.cursor()
+            for pragma in SQLITE_PRAGMAS:
+                cursor.execute(f"PRAGMA {pragma}")
+            cursor.close()
 else:
     # PostgreSQL or other databases
     engine = create_engine(DATABASE_URL, pool_pre_ping=True, pool_size=10, max_overflow=20)
 
-# Create session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+# Create session factory. Instances keep their loaded state across commit
+# (all column defaults are client-side), so writes need no re-SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 def init_db():
@@ -0,0 +1,81 @@
+"""
+In-process caching for STEALTH Bot
+Short-lived TTL cache for expensive read paths without an external store
+"""
+from typing import Any, Callable, Dict, Hashable, Tuple
+from functools import wraps
+import copy
+import inspect
+import threading
+import time
+
+
+class TTLCache:
+    """Thread-safe key/value cache whose entries expire after a fixed TTL"""
+    
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._lock = threading.Lock()
+    
+    def get_or_set(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Return the cached value for key, calling loader on a miss"""
+        now = time.monotonic()
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None and entry[0] > now:
+                return entry[1]
+        
+        value = loader()
+        
+        with self._lock:
+            if len(self._data) >= self.maxsize:
+                # Drop expired entries first, then the oldest insertion
+                self._data = {k: v for k, v in self._data.items() if v[0] > now}
+                if len(self._data) >= self.maxsize:
+                    self._data.pop(next(iter(self._data)))
+            self._data[key] = (now + self.ttl, value)
+        return value
+    
+    def clear(self):
+        """Invalidate all entries"""
+        with self._lock:
+            self._data.clear()
+
+
+def cached_method(cache: TTLCache) -> Callable:
+    """
+    Decorator to memoize an instance method in a shared TTL cache
+    
+    The instance itself is not part of the key, so results are shared
+    across instances (e.g. per-request calculators over the same database).
+    Arguments are bound to the signature with defaults applied, so f(30),
+    f(days=30) and f() share one entry. Callers get a deep copy of the
+    cached result and may mutate it freely.
+    
+    Args:
+        cache: Cache instance to store results in
+    
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        
+        @wraps(func)
+        def wrapper(self, *args, **kwargs):
+            bound = signature.bind(self, *args, **kwargs)
+            bound.apply_defaults()
+            key = (func.__name__,) + tuple(bound.arguments.items())[1:]
+            return copy.deepcopy(cache.get_or_set(key, lambda: func(self, *args, **kwargs)))
+        
+        return wrapper
+    
+    return decorator
+
+
+# Global caches
+PERFORMANCE_CACHE = TTLCache(ttl=30)
+MOCK_DATA_CACHE = TTLCache(ttl=1.0, maxsize=16)
+MOCK_SIGNALS_CACHE = TTLCache(ttl=30, maxsize=1)
@@ -3,19 +3,49 @@ File-based Logging with Rotation
 Writes logs to files with automatic rotation
 """
 import os
-import json
+import copy
+import queue
+import atexit
 import logging
+import orjson
 from datetime import datetime
 from pathlib import Path
-from logging.handlers import RotatingFileHandler, TimedRotatingFileHandler
+from typing import Dict, Optional
+from logging.handlers import (
+    QueueHandler, QueueListener, RotatingFileHandler, TimedRotatingFileHandler
+)
+
+
+# Bound on records waiting for the file-writer thread; beyond it records are dropped
+LOG_QUEUE_SIZE = 10000
+
+# Write buffer for the high-volume log files
+LOG_BUFFER_SIZE = 64 * 1024
+
+# Volume limits for the high-traffic log files (see RateSampleFilter)
+DEBUG_SAMPLE_EVERY = 10
+DUPLICATE_WINDOW_SECONDS = 5.0
+DUPLICATE_HISTORY = 256
+INFO_RATE_PER_SECOND = 1000
+
+# Background thread that writes queued records to the log files
+_listener: Optional[QueueListener] = None
 
 
 class JSONFileFormatter(logging.Formatter):
     """Custom JSON formatter for file logging"""
     
     def format(self, record):
+        # The main file and a named-logger file both format the same record;
+        # encode it once per formatter
+        cached = record.__dict__.get('_json_line')
+        if cached is not None and cached[0] is self:
+            return cached[1]
+        
+        # Stamp with the record's creation time (records may be written later
+        # by the listener thread); orjson writes datetimes in isoformat() form
         log_obj = {
-            'timestamp': datetime.now().isoformat(),
+            'timestamp': datetime.fromtimestamp(record.created),
             'level': record.levelname,
             'module': record.module,
             'function': record.funcName,
@@ -23,21 +53,187 @@ class JSONFileFormatter(logging.Formatter):
             'message': record.getMessage()
         }
         
-        # Add exception info if present
+        # Add exception info if present (already rendered when queued)
         if record.exc_info:
             log_obj['exception'] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_obj['exception'] = record.exc_text
             
         # Add extra fields if present
         if hasattr(record, 'extra_data'):
             log_obj['data'] = record.extra_data
             
-        return json.dumps(log_obj)
+        line = orjson.dumps(log_obj, option=orjson.OPT_NON_STR_KEYS).decode()
+        record._json_line = (self, line)
+        return line
+
+
+class RateSampleFilter(logging.Filter):
+    """
+    Cut log volume on a handler without losing warnings or errors
+    
+    Below WARNING: keeps one DEBUG record in DEBUG_SAMPLE_EVERY, drops a
+    record identical to one logged within DUPLICATE_WINDOW_SECONDS, and caps
+    INFO at INFO_RATE_PER_SECOND with a token bucket. Time is taken from
+    record.created, so the limits hold even when records are written late.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._debug_count = 0
+        self._seen: Dict[int, float] = {}
+        self._tokens = float(INFO_RATE_PER_SECOND)
+        self._last_refill = 0.0
+    
+    def filter(self, record):
+        level = record.levelno
+        if level >= logging.WARNING:
+            return True
+        
+        if level <= logging.DEBUG:
+            self._debug_count += 1
+            if self._debug_count % DEBUG_SAMPLE_EVERY != 1:
+                return False
+        
+        # Duplicate suppression over the most recently logged distinct messages;
+        # a message that keeps repeating is still logged once per window.
+        # Structured records share a message but differ in extra_data, so
+        # they are never treated as duplicates.
+        now = record.created
+        key = None
+        if not hasattr(record, 'extra_data'):
+            key = hash((record.name, level, str(record.msg)))
+            last_logged = self._seen.get(key)
+            if last_logged is not None and now - last_logged < DUPLICATE_WINDOW_SECONDS:
+                return False
+        
+        if level >= logging.INFO:
+            elapsed = max(0.0, now - self._last_refill)
+            self._tokens = min(INFO_RATE_PER_SECOND, self._tokens + elapsed * INFO_RATE_PER_SECOND)
+            self._last_refill = now
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+        
+        if key is not None:
+            self._seen.pop(key, None)
+            self._seen[key] = now
+            if len(self._seen) > DUPLICATE_HISTORY:
+                del self._seen[next(iter(self._seen))]
+        return True
+
+
+class _FileQueueHandler(QueueHandler):
+    """Hands records to the file-writer thread without blocking the caller"""
+    
+    _exc_formatter = logging.Formatter()
+    
+    def prepare(self, record):
+        # Merge args and render the traceback now, but leave formatting to the
+        # file handlers' JSON formatter (the base class would pre-format it)
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        if record.exc_info:
+            record.exc_text = self._exc_formatter.formatException(record.exc_info)
+            record.exc_info = None
+        return record
+    
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Shed file logging under overload rather than stall the caller
+            pass
+
+
+class BufferedRotatingFileHandler(RotatingFileHandler):
+    """
+    RotatingFileHandler that buffers writes instead of flushing every record
+    
+    Tracks the bytes it writes, so the rollover check needs no seek/tell
+    (which would flush the buffer). That count goes stale when the file is
+    truncated behind the handler's back (/logs/clear), so it is re-read from
+    the file before any rollover. Buffered lines reach disk when the buffer
+    fills, on rollover/close, or when the log listener goes idle.
+    """
+    
+    def _open(self):
+        stream = open(
+            self.baseFilename, self.mode, buffering=LOG_BUFFER_SIZE,
+            encoding=self.encoding, errors=self.errors
+        )
+        self._size = os.fstat(stream.fileno()).st_size
+        # See bpo-45401: never roll over anything other than a regular file
+        self._rollable = os.path.isfile(self.baseFilename)
+        return stream
+    
+    def shouldRollover(self, record):
+        if self.stream is None:
+            self.stream = self._open()
+        if self.maxBytes <= 0 or not self._rollable:
+            return False
+        needed = self._byte_length(self.format(record) + self.terminator)
+        if self._size + needed < self.maxBytes:
+            return False
+        # About to roll over: trust the file, not the running count
+        self.stream.flush()
+        self._size = os.fstat(self.stream.fileno()).st_size
+        return self._size + needed >= self.maxBytes
+    
+    def _byte_length(self, msg):
+        return len(msg.encode(self.stream.encoding, self.stream.errors))
+    
+    def emit(self, record):
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self._size += self._byte_length(msg)
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+class _FlushingQueueListener(QueueListener):
+    """QueueListener that flushes its handlers each time the queue drains"""
+    
+    def dequeue(self, block):
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            pass
+        
+        # Caught up: push buffered lines to disk before waiting, so a burst
+        # costs one write per file and nothing lingers while logging is quiet
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get(block)
+
+
+def _stop_listener():
+    """Drain queued records, then close the file handlers"""
+    global _listener
+    if _listener is None:
+        return
+    _listener.stop()
+    for handler in _listener.handlers:
+        handler.close()
+    _listener = None
+
+
+atexit.register(_stop_listener)
 
 
 def setup_file_logging(log_dir: str = 'logs', level=None):
     """
     Setup comprehensive file logging with rotation
     
+    File handlers run on a single QueueListener thread; loggers only enqueue
+    records, so callers never wait on formatting or disk writes.
+    
     Args:
         log_dir: Directory to store log files
         level: Logging level
@@ -50,8 +246,9 @@ def setup_file_logging(log_dir: str = 'logs', level=None):
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
     
-    # Clear existing handlers
+    # Clear existing handlers (and flush any previous file writer)
     root_logger.handlers = []
+    _stop_listener()
     
     # Console handler (simple format)
     console_handler = logging.StreamHandler()
@@ -61,15 +258,18 @@ def setup_file_logging(log_dir: str = 'logs', level=None):
     console_handler.setFormatter(console_formatter)
     root_logger.addHandler(console_handler)
     
+    # One stateless JSON formatter shared by every file handler
+    json_formatter = JSONFileFormatter()
+    
     # Main log file (all logs) with size rotation
-    main_handler = RotatingFileHandler(
+    main_handler = BufferedRotatingFileHandler(
         log_path / 'stealth_bot.log',
         maxBytes=10*1024*1024,  # 10MB
         backupCount=5
     )
-    main_handler.setFormatter(JSONFileFormatter())
+    main_handler.setFormatter(json_formatter)
     main_handler.setLevel(logging.DEBUG)
-    root_logger.addHandler(main_handler)
+    main_handler.addFilter(RateSampleFilter())
     
     # Error log file (errors only)
     error_handler = RotatingFileHandler(
@@ -77,19 +277,17 @@ def setup_file_logging(log_dir: str = 'logs', level=None):
         maxBytes=5*1024*1024,  # 5MB
         backupCount=3
     )
-    error_handler.setFormatter(JSONFileFormatter())
+    error_handler.setFormatter(json_formatter)
     error_handler.setLevel(logging.ERROR)
-    root_logger.addHandler(error_handler)
     
     # Trading log file (trading events)
-    trading_handler = RotatingFileHandler(
+    trading_handler = BufferedRotatingFileHandler(
         log_path / 'trading.log',
         maxBytes=10*1024*1024,  # 10MB
         backupCount=10
     )
-    trading_handler.setFormatter(JSONFileFormatter())
-    trading_logger = logging.getLogger('trading')
-    trading_logger.addHandler(trading_handler)
+    trading_handler.setFormatter(json_formatter)
+    trading_handler.addFilter(logging.Filter('trading'))
     
     # Performance log file (daily rotation)
     perf_handler = TimedRotatingFileHandler(
@@ -98,23 +296,42 @@ def setup_file_logging(log_dir: str = 'logs', level=None):
         interval=1,
         backupCount=30  # Keep 30 days
     )
-    perf_handler.setFormatter(JSONFileFormatter())
-    perf_logger = logging.getLogger('performance')
-    perf_logger.addHandler(perf_handler)
+    perf_handler.setFormatter(json_formatter)
+    perf_handler.addFilter(logging.Filter('performance'))
     
     # Market data log file
-    market_handler = RotatingFileHandler(
+    market_handler = BufferedRotatingFileHandler(
         log_path / 'market_data.log',
         maxBytes=20*1024*1024,  # 20MB
         backupCount=3
     )
-    market_handler.setFormatter(JSONFileFormatter())
-    market_logger = logging.getLogger('market')
-    market_logger.addHandler(market_handler)
+    market_handler.setFormatter(json_formatter)
+    market_handler.addFilter(logging.Filter('market'))
+    market_handler.addFilter(RateSampleFilter())
+    
+    # Every logger propagates to root, so one queue feeds all file handlers;
+    # the name filters above keep the trading/performance/market files scoped
+    # to their logger trees
+    global _listener
+    log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+    root_logger.addHandler(_FileQueueHandler(log_queue))
+    _listener = _FlushingQueueListener(
+        log_queue, main_handler, error_handler, trading_handler, perf_handler, market_handler,
+        respect_handler_level=True
+    )
+    _listener.start()
     
     return root_logger
 
 
+class ExtraAdapter(logging.LoggerAdapter):
+    """Logger adapter that attaches its extra dict to every record as extra_data"""
+    
+    def process(self, msg, kwargs):
+        kwargs['extra'] = {'extra_data': self.extra}
+        return msg, kwargs
+
+
 def get_logger(name: str, extra_data: dict = None):
     """
     Get a logger with optional extra data
@@ -126,12 +343,6 @@ def get_logger(name: str, extra_data: dict = None):
     logger = logging.getLogger(name)
     
     if extra_data:
-        # Create adapter to add extra data
-        class ExtraAdapter(logging.LoggerAdapter):
-            def process(self, msg, kwargs):
-                kwargs['extra'] = {'extra_data': self.extra}
-                return msg, kwargs
-        
         return ExtraAdapter(logger, extra_data)
     
-    return logger
\ No newline at end of file
+    return logger
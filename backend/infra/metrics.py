@@ -3,13 +3,22 @@ Metrics collection for STEALTH Bot
 Simple metrics implementation without Prometheus dependency
 """
 from typing import Dict, Any, Callable
-from functools import wraps
+from collections import deque
+from functools import partial, wraps
+import random
 import time
+import numpy as np
+
+
+# Observations a histogram keeps for quantiles; older ones only count toward count/sum
+HISTOGRAM_WINDOW = 4096
 
 
 class Counter:
     """Simple counter metric"""
     
+    __slots__ = ('value', 'labels_data')
+    
     def __init__(self):
         self.value = 0
         self.labels_data = {}
@@ -19,22 +28,37 @@ class Counter:
         self.value += amount
     
     def labels(self, **kwargs):
-        """Return labeled counter"""
-        key = tuple(sorted(kwargs.items()))
-        if key not in self.labels_data:
-            self.labels_data[key] = Counter()
-        return self.labels_data[key]
+        """Return labeled counter (label values must be hashable)"""
+        # Order-free key without sorting the label items
+        key = frozenset(kwargs.items())
+        child = self.labels_data.get(key)
+        if child is None:
+            child = self.labels_data[key] = Counter()
+        return child
 
 
 class Histogram:
-    """Simple histogram metric"""
+    """Simple histogram metric over a bounded window of recent observations"""
     
-    def __init__(self):
-        self.values = []
+    __slots__ = ('values', 'count', 'sum')
+    
+    def __init__(self, window: int = HISTOGRAM_WINDOW):
+        self.values = deque(maxlen=window)
+        self.count = 0
+        self.sum = 0.0
     
     def observe(self, value):
         """Record an observation"""
         self.values.append(value)
+        self.count += 1
+        self.sum += value
+    
+    def quantile(self, q: float) -> float:
+        """Quantile (0-1) of the recent observations, 0.0 if there are none"""
+        if not self.values:
+            return 0.0
+        recent = np.fromiter(self.values, dtype=np.float64, count=len(self.values))
+        return float(np.quantile(recent, q))
 
 
 # Global metrics
@@ -44,23 +68,34 @@ SIGNALS_BY_TIER = Counter()
 REJECT_COUNT = Counter()
 
 
-def orchestrator_metrics(func: Callable) -> Callable:
+def orchestrator_metrics(func: Callable = None, *, sample_rate: float = 1.0) -> Callable:
     """
     Decorator to track orchestrator metrics
     
+    Use bare (@orchestrator_metrics) to time every call, or with a
+    sample_rate (@orchestrator_metrics(sample_rate=0.1)) for functions on
+    hot paths; unsampled calls are not timed at all.
+    
     Args:
         func: Function to wrap
+        sample_rate: Fraction of calls whose latency is observed
         
     Returns:
         Wrapped function
     """
+    if func is None:
+        return partial(orchestrator_metrics, sample_rate=sample_rate)
+    
     @wraps(func)
     def wrapper(*args, **kwargs):
-        start = time.time()
+        if sample_rate < 1.0 and random.random() >= sample_rate:
+            return func(*args, **kwargs)
+        
+        start = time.perf_counter_ns()
         try:
             result = func(*args, **kwargs)
             return result
         finally:
-            REQUEST_LATENCY.observe(time.time() - start)
+            REQUEST_LATENCY.observe((time.perf_counter_ns() - start) * 1e-9)
     
-    return wrapper
\ No newline at end of file
+    return wrapper
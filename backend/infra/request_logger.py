@@ -3,9 +3,7 @@ Request Logging Middleware
 Logs all HTTP requests with timing and status
 """
 import time
-import json
-from datetime import datetime
-from typing import Callable
+from typing import Callable, Dict
 from fastapi import Request, Response
 from fastapi.routing import APIRoute
 import logging
@@ -13,6 +11,16 @@ import logging
 logger = logging.getLogger(__name__)
 
 
+def _request_data(request: Request) -> Dict:
+    """Fields describing a request for the structured log"""
+    return {
+        'method': request.method,
+        'path': request.url.path,
+        'query_params': dict(request.query_params),
+        'client': request.client.host if request.client else None
+    }
+
+
 class LoggingRoute(APIRoute):
     """Custom route class that logs requests"""
     
@@ -20,44 +28,51 @@ class LoggingRoute(APIRoute):
         original_route_handler = super().get_route_handler()
         
         async def custom_route_handler(request: Request) -> Response:
-            start_time = time.time()
+            start_time = time.perf_counter()
             
-            # Log request
-            log_data = {
-                'timestamp': datetime.now().isoformat(),
-                'method': request.method,
-                'path': request.url.path,
-                'query_params': dict(request.query_params),
-                'client': request.client.host if request.client else None
-            }
-            
-            logger.info(f"Request started: {json.dumps(log_data)}")
+            # Log request. The dict rides along as extra_data, so the JSON file
+            # formatter encodes it once with the record (no json.dumps here).
+            # Each record gets its own dict: records are written asynchronously
+            log_info = logger.isEnabledFor(logging.INFO)
+            log_data = _request_data(request) if log_info else None
+            if log_info:
+                logger.info(
+                    "Request started: %s %s", request.method, request.url.path,
+                    extra={'extra_data': log_data}
+                )
             
             try:
                 response: Response = await original_route_handler(request)
-                process_time = time.time() - start_time
+                process_time = time.perf_counter() - start_time
                 
                 # Log response
-                log_data.update({
-                    'status_code': response.status_code,
-                    'process_time': round(process_time * 1000, 2),  # ms
-                    'success': 200 <= response.status_code < 400
-                })
-                
-                logger.info(f"Request completed: {json.dumps(log_data)}")
+                if log_info:
+                    logger.info(
+                        "Request completed: %s %s %d", request.method, request.url.path,
+                        response.status_code,
+                        extra={'extra_data': {
+                            **log_data,
+                            'status_code': response.status_code,
+                            'process_time': round(process_time * 1000, 2),  # ms
+                            'success': 200 <= response.status_code < 400
+                        }}
+                    )
                 
                 # Add timing header
                 response.headers["X-Process-Time"] = str(process_time)
                 return response
                 
             except Exception as e:
-                process_time = time.time() - start_time
-                log_data.update({
-                    'error': str(e),
-                    'process_time': round(process_time * 1000, 2),
-                    'success': False
-                })
-                logger.error(f"Request failed: {json.dumps(log_data)}")
+                process_time = time.perf_counter() - start_time
+                logger.error(
+                    "Request failed: %s %s", request.method, request.url.path,
+                    extra={'extra_data': {
+                        **(log_data or _request_data(request)),
+                        'error': str(e),
+                        'process_time': round(process_time * 1000, 2),
+                        'success': False
+                    }}
+                )
                 raise
         
-        return custom_route_handler
\ No newline at end of file
+        return custom_route_handler
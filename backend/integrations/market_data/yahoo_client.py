@@ -2,6 +2,9 @@
 Yahoo Finance market data provider
 """
 import yfinance as yf
+import requests
+from requests.adapters import HTTPAdapter
+from bisect import bisect_right
 from typing import Dict, List, Optional
 from datetime import datetime, timedelta
 import logging
@@ -9,6 +12,17 @@ from .base import MarketDataProvider
 
 logger = logging.getLogger(__name__)
 
+# Weekday session boundaries (ET), in minutes since midnight, and the
+# (status, session) in effect before each boundary / after the last one
+_SESSION_BOUNDARIES = (4 * 60, 9 * 60 + 30, 16 * 60, 20 * 60)
+_SESSIONS = (
+    ("CLOSED", "After Hours"),
+    ("OPEN", "Pre-Market"),
+    ("OPEN", "Regular"),
+    ("OPEN", "After Hours"),
+    ("CLOSED", "Closed"),
+)
+
 
 class YahooFinanceClient(MarketDataProvider):
     """Yahoo Finance data provider using yfinance library"""
@@ -19,9 +33,12 @@ class YahooFinanceClient(MarketDataProvider):
         API key can be used for RapidAPI if needed in future
         """
         self.api_key = api_key
+        self._session = self._create_session()
         self._cache = {}
         self._cache_ttl = 30  # seconds (increased from 5 to reduce API calls)
         self._last_cache_time = {}
+        self._cache_hits = 0
+        self._cache_misses = 0
     
     def get_quote(self, symbol: str) -> Dict:
         """Get current quote for a symbol"""
@@ -29,9 +46,11 @@ class YahooFinanceClient(MarketDataProvider):
             # Check cache
             if self._is_cached(symbol):
                 logger.debug(f"Returning cached quote for {symbol}")
+                self._cache_hits += 1
                 return self._cache[symbol]
+            self._cache_misses += 1
             
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             info = ticker.info
             
             # Get current price and change
@@ -80,16 +99,38 @@ class YahooFinanceClient(MarketDataProvider):
             }
     
     def get_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
-        """Get quotes for multiple symbols"""
+        """
+        Get quotes for multiple symbols
+        
+        Cached symbols are served from the cache; the rest are fetched with a
+        single batched yf.download call instead of one .info request each.
+        """
         quotes = {}
+        missing = []
         for symbol in symbols:
+            if self._is_cached(symbol):
+                self._cache_hits += 1
+                quotes[symbol] = self._cache[symbol]
+            elif symbol not in quotes:
+                quotes[symbol] = None
+                missing.append(symbol)
+        
+        if len(missing) > 1:
+            try:
+                quotes.update(self._download_quotes(missing))
+                missing = [symbol for symbol in missing if quotes[symbol] is None]
+            except Exception as e:
+                logger.warning("Batch quote download failed, fetching individually: %s", e)
+        
+        # Single misses, and anything the batch did not return, go through get_quote
+        for symbol in missing:
             quotes[symbol] = self.get_quote(symbol)
         return quotes
     
     def get_historical(self, symbol: str, period: str = "1d") -> Dict:
         """Get historical data for a symbol"""
         try:
-            ticker = yf.Ticker(symbol)
+            ticker = yf.Ticker(symbol, session=self._session)
             hist = ticker.history(period=period)
             
             return {
@@ -109,7 +150,7 @@ class YahooFinanceClient(MarketDataProvider):
         """Test if the connection is working"""
         try:
             # Test with a known symbol
-            ticker = yf.Ticker("SPY")
+            ticker = yf.Ticker("SPY", session=self._session)
             info = ticker.info
             return 'symbol' in info or 'shortName' in info
         except Exception as e:
@@ -119,27 +160,13 @@ class YahooFinanceClient(MarketDataProvider):
     def get_market_status(self) -> Dict:
         """Get current market status"""
         now = datetime.now()
-        hour = now.hour
         
         # Simple market hours check (ET)
         if now.weekday() >= 5:  # Weekend
-            status = "CLOSED"
-            session = "Weekend"
-        elif hour < 4:
-            status = "CLOSED"
-            session = "After Hours"
-        elif 4 <= hour < 9.5:
-            status = "OPEN"
-            session = "Pre-Market"
-        elif 9.5 <= hour < 16:
-            status = "OPEN"
-            session = "Regular"
-        elif 16 <= hour < 20:
-            status = "OPEN"
-            session = "After Hours"
+            status, session = "CLOSED", "Weekend"
         else:
-            status = "CLOSED"
-            session = "Closed"
+            minutes = now.hour * 60 + now.minute
+            status, session = _SESSIONS[bisect_right(_SESSION_BOUNDARIES, minutes)]
         
         return {
             'status': status,
@@ -147,6 +174,71 @@ class YahooFinanceClient(MarketDataProvider):
             'timestamp': now.isoformat()
         }
     
+    def cache_stats(self) -> Dict:
+        """Get quote cache hit/miss counters"""
+        lookups = self._cache_hits + self._cache_misses
+        return {
+            'hits': self._cache_hits,
+            'misses': self._cache_misses,
+            'hit_rate': round(self._cache_hits / lookups * 100, 2) if lookups else 0.0,
+            'cached_symbols': len(self._cache),
+            'ttl_seconds': self._cache_ttl
+        }
+    
+    @staticmethod
+    def _create_session() -> requests.Session:
+        """Create a keep-alive session sized for quotes fetched from worker threads"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=32)
+        session.mount('https://', adapter)
+        session.mount('http://', adapter)
+        return session
+    
+    def _download_quotes(self, symbols: List[str]) -> Dict[str, Dict]:
+        """Fetch quotes for symbols from the last two daily bars in one request"""
+        data = yf.download(
+            symbols, period='2d', interval='1d', group_by='ticker',
+            threads=True, progress=False, session=self._session
+        )
+        
+        quotes = {}
+        now = datetime.now()
+        grouped = data.columns.nlevels > 1
+        for symbol in symbols:
+            if grouped and symbol not in data.columns.get_level_values(0):
+                continue
+            bars = (data[symbol] if grouped else data).dropna(subset=['Close'])
+            if bars.empty:
+                continue
+            self._cache_misses += 1
+            
+            last = bars.iloc[-1]
+            current_price = float(last['Close'])
+            previous_close = float(bars['Close'].iloc[-2]) if len(bars) > 1 else 0
+            
+            # Batched bars carry no profile data; keep what a full quote last reported
+            previous = self._cache.get(symbol, {})
+            quote = {
+                'symbol': symbol,
+                'price': current_price,
+                'change': current_price - previous_close if previous_close else 0,
+                'change_percent': ((current_price - previous_close) / previous_close * 100) if previous_close else 0,
+                'volume': int(last['Volume']) if last['Volume'] == last['Volume'] else 0,  # NaN-safe
+                'high': float(last['High']),
+                'low': float(last['Low']),
+                'open': float(last['Open']),
+                'previous_close': previous_close,
+                'timestamp': now.isoformat(),
+                'market_cap': previous.get('market_cap', 0),
+                'name': previous.get('name', symbol)
+            }
+            
+            self._cache[symbol] = quote
+            self._last_cache_time[symbol] = now
+            quotes[symbol] = quote
+        
+        return quotes
+    
     def _is_cached(self, symbol: str) -> bool:
         """Check if symbol data is cached and still valid"""
         if symbol not in self._cache:
@@ -3,12 +3,55 @@ Universe Provider - Real stock screening and universe building
 Uses Yahoo Finance for dynamic stock discovery
 """
 import yfinance as yf
+import numpy as np
+import json
+import time
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain, islice
+from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime, timedelta
 import logging
 
+from backend.infra.cache import TTLCache
+
 logger = logging.getLogger(__name__)
 
+SP500_URL = 'https://en.wikipedia.org/wiki/List_of_S%26P_500_companies'
+
+# The constituent list changes rarely; refetch it (in memory and on disk) daily
+SP500_CACHE_TTL = 24 * 60 * 60
+_SP500_CACHE = TTLCache(ttl=SP500_CACHE_TTL, maxsize=1)
+# On-disk copy lives in the repo data directory, next to the database
+SP500_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "sp500.json"
+
+# Static symbol lists, built once at import
+# Top tech and popular stocks
+_MOST_ACTIVE = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'AMD', 
+    'NFLX', 'DIS', 'BABA', 'V', 'MA', 'JPM', 'BAC', 'WMT', 'PFE',
+    'INTC', 'CSCO', 'ORCL', 'CRM', 'ADBE', 'PYPL', 'QCOM', 'TXN',
+    'AVGO', 'COST', 'CMCSA', 'PEP', 'TMO', 'ABT', 'NKE', 'UNH',
+    'HD', 'MCD', 'VZ', 'T', 'MRK', 'LLY', 'KO', 'WFC', 'XOM',
+    'CVX', 'BA', 'GE', 'GM', 'F', 'AAL', 'UAL', 'CCL'
+)
+_SMALL_CAPS = (
+    'PLTR', 'SOFI', 'COIN', 'RIVN', 'LCID', 'HOOD', 'RBLX', 'U',
+    'DKNG', 'OPEN', 'AFRM', 'SQ', 'SNAP', 'PINS', 'UBER', 'LYFT',
+    'DASH', 'ABNB', 'ZM', 'DOCU', 'CRWD', 'SNOW', 'NET', 'DDOG',
+    'MDB', 'TEAM', 'OKTA', 'ZS', 'ESTC', 'SHOP'
+)
+_MEME_STOCKS = ('GME', 'AMC', 'BBBY', 'NOK', 'BB', 'WISH', 'CLOV', 'SPCE')
+_ETFS = ('SPY', 'QQQ', 'IWM', 'DIA', 'VTI', 'VOO', 'VEA', 'VWO', 'AGG', 'TLT')
+_DEFAULT_UNIVERSE = (
+    'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'AMD',
+    'NFLX', 'DIS', 'SPY', 'QQQ', 'GME', 'AMC', 'PLTR', 'SOFI',
+    'BA', 'COIN', 'RIVN', 'F', 'GM', 'AAL', 'BABA', 'V', 'MA'
+)
+
+# Concurrent Yahoo profile requests while filtering a universe
+FILTER_WORKERS = 16
+
 
 class UniverseProvider:
     """Provides trading universe from Yahoo Finance"""
@@ -23,106 +66,126 @@ class UniverseProvider:
     def get_sp500_symbols(self) -> List[str]:
         """Get S&P 500 constituent symbols"""
         try:
-            import pandas as pd
-            table = pd.read_html('https://en.wikipedia.org/wiki/List_of_S%26P_500_companies')
-            df = table[0]
-            symbols = df['Symbol'].tolist()
-            logger.info(f"Fetched {len(symbols)} S&P 500 symbols")
+            symbols = _SP500_CACHE.get_or_set('sp500', self._load_sp500_symbols)
             return symbols[:100]  # Limit to top 100 for performance
         except Exception as e:
             logger.error(f"Error fetching S&P 500 symbols: {e}")
             return self._get_default_universe()
     
+    def _load_sp500_symbols(self) -> List[str]:
+        """Read S&P 500 symbols from the on-disk cache, refetching once it is a day old"""
+        cache_path = Path(self.config.get('sp500_cache', SP500_CACHE_PATH))
+        cached = None
+        try:
+            cached = json.loads(cache_path.read_text())
+            if time.time() - cache_path.stat().st_mtime < SP500_CACHE_TTL:
+                return cached
+        except (OSError, ValueError):
+            pass
+        
+        try:
+            import pandas as pd
+            table = pd.read_html(SP500_URL)
+            symbols = table[0]['Symbol'].tolist()
+            logger.info(f"Fetched {len(symbols)} S&P 500 symbols")
+        except Exception as e:
+            if not cached:
+                raise
+            logger.warning(f"Error refreshing S&P 500 symbols, using cached list: {e}")
+            return cached
+        
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            cache_path.write_text(json.dumps(symbols))
+        except OSError as e:
+            logger.warning(f"Could not write S&P 500 cache {cache_path}: {e}")
+        return symbols
+    
     def get_most_active(self, limit: int = 50) -> List[str]:
         """Get most active stocks by volume"""
-        # Top tech and popular stocks
-        active_stocks = [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'AMD', 
-            'NFLX', 'DIS', 'BABA', 'V', 'MA', 'JPM', 'BAC', 'WMT', 'PFE',
-            'INTC', 'CSCO', 'ORCL', 'CRM', 'ADBE', 'PYPL', 'QCOM', 'TXN',
-            'AVGO', 'COST', 'CMCSA', 'PEP', 'TMO', 'ABT', 'NKE', 'UNH',
-            'HD', 'MCD', 'VZ', 'T', 'MRK', 'LLY', 'KO', 'WFC', 'XOM',
-            'CVX', 'BA', 'GE', 'GM', 'F', 'AAL', 'UAL', 'CCL'
-        ]
-        return active_stocks[:limit]
+        return list(_MOST_ACTIVE[:limit])
     
     def get_small_caps(self, limit: int = 30) -> List[str]:
         """Get small cap stocks with potential"""
-        small_caps = [
-            'PLTR', 'SOFI', 'COIN', 'RIVN', 'LCID', 'HOOD', 'RBLX', 'U',
-            'DKNG', 'OPEN', 'AFRM', 'SQ', 'SNAP', 'PINS', 'UBER', 'LYFT',
-            'DASH', 'ABNB', 'ZM', 'DOCU', 'CRWD', 'SNOW', 'NET', 'DDOG',
-            'MDB', 'TEAM', 'OKTA', 'ZS', 'ESTC', 'SHOP'
-        ]
-        return small_caps[:limit]
+        return list(_SMALL_CAPS[:limit])
     
     def get_meme_stocks(self) -> List[str]:
         """Get popular meme/retail stocks"""
-        return ['GME', 'AMC', 'BBBY', 'NOK', 'BB', 'WISH', 'CLOV', 'SPCE']
+        return list(_MEME_STOCKS)
     
     def get_etfs(self) -> List[str]:
         """Get major ETFs for market monitoring"""
-        return ['SPY', 'QQQ', 'IWM', 'DIA', 'VTI', 'VOO', 'VEA', 'VWO', 'AGG', 'TLT']
+        return list(_ETFS)
     
     def filter_universe(self, symbols: List[str]) -> List[str]:
         """Filter symbols by price, volume, and market cap criteria"""
-        filtered = []
+        prices, volumes, market_caps = self._quote_arrays(self._fetch_infos(symbols))
         
-        for symbol in symbols:
-            try:
-                ticker = yf.Ticker(symbol)
-                info = ticker.info
-                
-                # Get current price
-                price = info.get('currentPrice') or info.get('regularMarketPrice')
-                if not price or price < self.min_price or price > self.max_price:
-                    continue
-                
-                # Check volume
-                volume = info.get('volume') or info.get('regularMarketVolume')
-                if not volume or volume < self.min_volume:
-                    continue
-                
-                # Check market cap
-                market_cap = info.get('marketCap')
-                if market_cap and market_cap < self.min_market_cap:
-                    continue
-                
-                filtered.append(symbol)
-                
-            except Exception as e:
-                logger.warning(f"Error filtering {symbol}: {e}")
-                continue
+        # Missing (or zero) price/volume fails; a missing market cap passes, as
+        # NaN compares False
+        mask = (prices >= self.min_price) & (prices <= self.max_price) & (volumes >= self.min_volume)
+        mask &= ~(market_caps < self.min_market_cap)
+        filtered = [symbols[i] for i in np.flatnonzero(mask)]
         
         logger.info(f"Filtered {len(filtered)} symbols from {len(symbols)}")
         return filtered
     
+    @staticmethod
+    def _quote_arrays(infos: List[Optional[Dict]]):
+        """Columnar (price, volume, market cap) arrays for the filter, NaN where unknown"""
+        infos = [info or {} for info in infos]
+        count = len(infos)
+        prices = np.fromiter(
+            (info.get('currentPrice') or info.get('regularMarketPrice') or np.nan for info in infos),
+            dtype=np.float64, count=count
+        )
+        volumes = np.fromiter(
+            (info.get('volume') or info.get('regularMarketVolume') or np.nan for info in infos),
+            dtype=np.float64, count=count
+        )
+        market_caps = np.fromiter(
+            (info.get('marketCap') or np.nan for info in infos),
+            dtype=np.float64, count=count
+        )
+        return prices, volumes, market_caps
+    
+    def _fetch_infos(self, symbols: List[str]) -> List[Optional[Dict]]:
+        """Fetch Yahoo profile info for symbols concurrently (None where a fetch fails)"""
+        if not symbols:
+            return []
+        
+        # Each .info is an independent HTTPS round trip; overlap them
+        with ThreadPoolExecutor(
+            max_workers=min(FILTER_WORKERS, len(symbols)), thread_name_prefix="universe-filter"
+        ) as pool:
+            return list(pool.map(self._fetch_info, symbols))
+    
+    @staticmethod
+    def _fetch_info(symbol: str) -> Optional[Dict]:
+        """Fetch Yahoo profile info for one symbol"""
+        try:
+            return yf.Ticker(symbol).info
+        except Exception as e:
+            logger.warning(f"Error filtering {symbol}: {e}")
+            return None
+    
     def get_full_universe(self, max_size: int = 200) -> List[str]:
         """Get comprehensive trading universe"""
-        universe = set()
-        
-        # Add different categories
-        universe.update(self.get_most_active(50))
-        universe.update(self.get_small_caps(30))
-        universe.update(self.get_meme_stocks())
-        universe.update(self.get_etfs())
-        
-        # Optionally add S&P 500 (expensive API calls)
-        # universe.update(self.get_sp500_symbols())
-        
-        # Convert to list and limit size
-        universe_list = list(universe)[:max_size]
+        # Dedupe while keeping category order, so the universe (and what
+        # max_size cuts off) is the same on every call
+        universe = dict.fromkeys(chain(
+            _MOST_ACTIVE[:50], _SMALL_CAPS[:30], _MEME_STOCKS, _ETFS
+            # Optionally add S&P 500 (expensive API calls)
+            # self.get_sp500_symbols(),
+        ))
+        universe_list = list(islice(universe, max_size))
         
         logger.info(f"Built universe with {len(universe_list)} symbols")
         return universe_list
     
     def _get_default_universe(self) -> List[str]:
         """Fallback universe if API fails"""
-        return [
-            'AAPL', 'MSFT', 'GOOGL', 'AMZN', 'NVDA', 'TSLA', 'META', 'AMD',
-            'NFLX', 'DIS', 'SPY', 'QQQ', 'GME', 'AMC', 'PLTR', 'SOFI',
-            'BA', 'COIN', 'RIVN', 'F', 'GM', 'AAL', 'BABA', 'V', 'MA'
-        ]
+        return list(_DEFAULT_UNIVERSE)
     
     def get_symbols(self) -> List[str]:
         """Main method to get trading symbols"""
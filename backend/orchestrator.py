@@ -6,12 +6,12 @@ aggregates outputs, handles logging, metrics, and alerts.
 
 import time
 import traceback
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import logging
 from concurrent.futures import ThreadPoolExecutor, as_completed
 
-from backend.core.config_loader import load_config, is_module_enabled
+from backend.core.config_loader import load_config, get_module_config, is_module_enabled
 from backend.modules.obv_vwap_engine import OBVVWAPEngine
 from backend.modules.float_churn import FloatChurnEngine
 from backend.modules.dilution_detector import DilutionDetector
@@ -29,7 +29,7 @@ from backend.modules.market_scanner import MarketScanner
 from backend.modules.performance_log import PerformanceLogger
 from backend.integrations.market_data import YahooFinanceClient
 from backend.infra.metrics import (
-    REQUEST_COUNT, REQUEST_LATENCY, SIGNALS_BY_TIER, 
+    REQUEST_COUNT, SIGNALS_BY_TIER, 
     REJECT_COUNT, orchestrator_metrics
 )
 from backend.infra.logging_setup import setup_json_logging
@@ -60,7 +60,7 @@ class StealthBotOrchestrator:
         self._initialize_modules()
         
         self.logger.info("STEALTH Bot Orchestrator initialized", 
-                        extra={"modules": list(self.modules.keys())})
+                        extra={"modules": list(self._module_names)})
     
     def _setup_logging(self) -> logging.Logger:
         """Setup JSON logging for the orchestrator."""
@@ -96,13 +96,20 @@ class StealthBotOrchestrator:
         }
         
         for module_name, module_class in module_classes.items():
-            if is_module_enabled(self.config, module_name):
-                try:
-                    module_config = self.config['modules'].get(module_name, {})
-                    self.modules[module_name] = module_class(module_config)
-                    self.logger.info(f"Initialized module: {module_name}")
-                except Exception as e:
-                    self.logger.error(f"Failed to initialize module {module_name}: {e}")
+            if not is_module_enabled(self.config, module_name):
+                continue
+            try:
+                self.modules[module_name] = module_class(get_module_config(self.config, module_name))
+                self.logger.info(f"Initialized module: {module_name}")
+            except Exception as e:
+                self.logger.error(f"Failed to initialize module {module_name}: {e}")
+        
+        # Modules are fixed after initialization, so snapshot their names once
+        self._module_names = tuple(self.modules)
+    
+    def module_names(self) -> Tuple[str, ...]:
+        """Names of the initialized modules, in initialization order."""
+        return self._module_names
     
     def _auto_wired_modules(self, universe_provider: Any) -> Dict[str, Any]:
         """
@@ -138,7 +145,7 @@ class StealthBotOrchestrator:
         Returns:
             Aggregated results from all modules
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         REQUEST_COUNT.inc()
         
         results = {
@@ -219,10 +226,8 @@ class StealthBotOrchestrator:
             })
         
         finally:
-            # Record latency
-            latency = time.time() - start_time
-            REQUEST_LATENCY.observe(latency)
-            results['latency'] = latency
+            # Report latency (REQUEST_LATENCY is observed by @orchestrator_metrics)
+            results['latency'] = time.perf_counter() - start_time
         
         return results
     
@@ -0,0 +1,53 @@
+"""
+Tests for the buffered rotating log file handler
+"""
+import logging
+import os
+
+from backend.infra.file_logger import BufferedRotatingFileHandler
+
+
+def _record(msg: str) -> logging.LogRecord:
+    return logging.LogRecord('test', logging.INFO, __file__, 0, msg, None, None)
+
+
+def _handler(path, max_bytes: int) -> BufferedRotatingFileHandler:
+    handler = BufferedRotatingFileHandler(path, maxBytes=max_bytes, backupCount=3, encoding='utf-8')
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    return handler
+
+
+def test_no_rollover_after_external_truncation(tmp_path):
+    path = tmp_path / 'app.log'
+    handler = _handler(path, 2000)
+    try:
+        for _ in range(19):
+            handler.emit(_record('x' * 99))
+        handler.flush()
+        assert path.stat().st_size == 1900
+        
+        # What /logs/clear does to a live log file
+        os.truncate(path, 0)
+        handler.emit(_record('a' * 59))
+        handler.emit(_record('b' * 59))
+        handler.flush()
+    finally:
+        handler.close()
+    
+    assert not (tmp_path / 'app.log.1').exists()
+    assert path.read_text(encoding='utf-8') == 'a' * 59 + '\n' + 'b' * 59 + '\n'
+
+
+def test_rollover_counts_encoded_bytes(tmp_path):
+    path = tmp_path / 'app.log'
+    handler = _handler(path, 100)
+    try:
+        # 30 characters but 61 bytes per line once UTF-8 encoded
+        handler.emit(_record('é' * 30))
+        handler.emit(_record('é' * 30))
+        handler.flush()
+    finally:
+        handler.close()
+    
+    assert (tmp_path / 'app.log.1').stat().st_size == 61
+    assert path.stat().st_size == 61
@@ -0,0 +1,98 @@
+"""
+Tests for the signal and trade repositories' batch inserts
+"""
+from datetime import datetime
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+
+from backend.api.routes.orchestration import _to_row
+from backend.database.models import Base
+from backend.database.repositories import SignalRepository, TradeRepository
+
+
+@pytest.fixture
+def db():
+    engine = create_engine('sqlite://', poolclass=StaticPool)
+    Base.metadata.create_all(engine)
+    session = sessionmaker(bind=engine, expire_on_commit=False)()
+    try:
+        yield session
+    finally:
+        session.close()
+        engine.dispose()
+
+
+def _scan_signal(symbol: str, price: float) -> dict:
+    return {
+        'symbol': symbol,
+        'tier': 'GOLD',
+        'confidence': 0.8,
+        'aggregate_score': 0.75,
+        'modules': {'market_scanner': {'price': price}},
+    }
+
+
+def test_signal_create_many_round_trips(db):
+    repo = SignalRepository(db)
+    created_at = datetime(2024, 1, 2, 15, 30)
+    rows = [
+        _to_row(_scan_signal('AAPL', 190.5), '20240102_153000', 0, created_at),
+        _to_row(_scan_signal('MSFT', 370.0), '20240102_153000', 1, created_at),
+    ]
+    
+    assert repo.create_many(rows) == 2
+    
+    signal = repo.get_by_id('SIG_20240102_153000_MSFT_1')
+    assert signal.symbol == 'MSFT'
+    assert signal.tier == 'GOLD'
+    assert signal.entry_price == 370.0
+    assert signal.modules_data == {'market_scanner': {'price': 370.0}}
+    assert signal.created_at == created_at
+    assert signal.status == 'ACTIVE'
+
+
+def test_signal_ids_unique_for_repeated_symbol_in_one_scan(db):
+    repo = SignalRepository(db)
+    scan = [_scan_signal('AAPL', 190.5), _scan_signal('AAPL', 190.7)]
+    rows = [_to_row(s, '20240102_153000', i, datetime(2024, 1, 2)) for i, s in enumerate(scan)]
+    
+    assert len({row['signal_id'] for row in rows}) == 2
+    assert repo.create_many(rows) == 2
+    assert sorted(s.entry_price for s in repo.get_by_symbol('AAPL')) == [190.5, 190.7]
+
+
+def test_create_many_with_no_rows(db):
+    assert SignalRepository(db).create_many([]) == 0
+    assert TradeRepository(db).create_many([]) == 0
+
+
+def test_trade_create_many_round_trips(db):
+    SignalRepository(db).create_many([
+        _to_row(_scan_signal('AAPL', 190.5), '20240102_153000', 0, datetime(2024, 1, 2))
+    ])
+    signal = SignalRepository(db).get_by_id('SIG_20240102_153000_AAPL_0')
+    repo = TradeRepository(db)
+    rows = [
+        {
+            'trade_id': f'TRD_{i}',
+            'signal_id': signal.id,
+            'symbol': 'AAPL',
+            'side': 'BUY',
+            'entry_price': 190.5,
+            'quantity': 10 + i,
+            'position_size': 190.5 * (10 + i),
+        }
+        for i in range(3)
+    ]
+    
+    assert repo.create_many(rows) == 3
+    
+    trades = repo.get_by_symbol('AAPL')
+    assert sorted(t.trade_id for t in trades) == ['TRD_0', 'TRD_1', 'TRD_2']
+    trade = repo.get_by_id('TRD_2')
+    assert trade.quantity == 12
+    assert trade.status == 'OPEN'
+    assert trade.pnl == 0.0
@@ -158,28 +158,29 @@ class TradeManager:
     
     def get_open_positions_summary(self, current_prices: Dict[str, float]) -> Dict:
         """Get summary of all open positions"""
-        open_trades = self.trade_repo.get_open_trades()
+        # Read-only, so plain column rows rather than ORM objects
+        open_trades = self.trade_repo.get_open_trade_rows()
         
         positions = []
         total_unrealized_pnl = 0.0
         
         for trade in open_trades:
-            current_price = current_prices.get(trade.symbol, trade.entry_price)
-            unrealized_pnl = (current_price - trade.entry_price) * trade.quantity
-            unrealized_pnl_percent = (unrealized_pnl / trade.position_size) * 100
+            current_price = current_prices.get(trade['symbol'], trade['entry_price'])
+            unrealized_pnl = (current_price - trade['entry_price']) * trade['quantity']
+            unrealized_pnl_percent = (unrealized_pnl / trade['position_size']) * 100
             
             total_unrealized_pnl += unrealized_pnl
             
             positions.append({
-                'trade_id': trade.trade_id,
-                'symbol': trade.symbol,
-                'quantity': trade.quantity,
-                'entry_price': trade.entry_price,
+                'trade_id': trade['trade_id'],
+                'symbol': trade['symbol'],
+                'quantity': trade['quantity'],
+                'entry_price': trade['entry_price'],
                 'current_price': current_price,
                 'unrealized_pnl': unrealized_pnl,
                 'unrealized_pnl_percent': unrealized_pnl_percent,
-                'stop_loss': trade.stop_loss,
-                'take_profit': trade.take_profit
+                'stop_loss': trade['stop_loss'],
+                'take_profit': trade['take_profit']
             })
         
         return {